@@ -0,0 +1,207 @@
+"""
+Caches the answers of the solutions, e.g.:
+    python runner.py --cache               # answers are looked up before solving
+    python answer_cache.py list            # cached answers, least recently used first
+    python answer_cache.py purge --day 15  # remove the answers of a day (or --all)
+
+Answers are keyed by a hash of the sources of the solution module and of the
+project modules it imports from (e.g. utils.py, see parse_cache.module_sources),
+of the input content, of the solver arguments and of the Python and NumPy
+versions, so they are invalidated as soon as any of them changes. Modules only
+imported from within functions and other third-party packages aren't covered.
+The least recently used answers are evicted once the total size of the stored
+answers exceeds a cap.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import os
+import pickle
+import sqlite3
+import sys
+import time
+from functools import lru_cache
+from types import ModuleType
+from typing import Any, NamedTuple
+
+from parse_cache import module_sources
+from utils import cache_dir
+
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    key TEXT PRIMARY KEY,
+    day INTEGER NOT NULL,
+    part INTEGER NOT NULL,
+    input_path TEXT NOT NULL,
+    answer BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+)
+"""
+
+# Digests of the files already hashed by this process, keyed by path, modification
+# time and size so that files are hashed again when they change
+_file_digests: dict[tuple[str, int, int], str] = {}
+
+
+class Entry(NamedTuple):
+    day: int
+    part: int
+    input_path: str
+    answer: Any
+    size: int  # bytes
+    last_used: float  # timestamp
+
+
+def file_digest(path: str) -> str:
+    stat = os.stat(path)
+    file_id = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    if file_id not in _file_digests:
+        with open(path, "rb") as f:
+            _file_digests[file_id] = hashlib.sha256(f.read()).hexdigest()
+    return _file_digests[file_id]
+
+
+@lru_cache(maxsize=None)
+def runtime_versions() -> str:
+    """Versions of Python and NumPy, read without importing NumPy."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        numpy_version = version("numpy")
+    except PackageNotFoundError:
+        numpy_version = None
+    return f"{sys.version} numpy {numpy_version}"
+
+
+def answer_key(
+    solution: ModuleType, part: int, input_path: str, solve_kwargs: dict[str, Any]
+) -> str:
+    key = hashlib.sha256()
+    for path in (*module_sources(solution.__name__), input_path):
+        key.update(file_digest(path).encode())
+    key.update(f"{part}{sorted(solve_kwargs.items())!r}".encode())
+    key.update(runtime_versions().encode())
+    return key.hexdigest()
+
+
+class AnswerCache:
+    """Answers stored in a SQLite database, evicted in least recently used order."""
+
+    def __init__(self, path: str | None = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = path or os.path.join(cache_dir("answers"), "answers.sqlite")
+        self.max_bytes = max_bytes
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        # Several runner processes may use the cache at once
+        self.connection = sqlite3.connect(self.path, timeout=30)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        # Losing the last answers on a power failure is fine for a cache
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(SCHEMA)
+
+    def __enter__(self) -> AnswerCache:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def lookup(self, key: str) -> tuple[bool, Any]:
+        """Returns whether the answer is cached, along with the answer if it is."""
+        row = self.connection.execute(
+            "SELECT answer FROM answers WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return False, None
+        with self.connection:
+            self.connection.execute(
+                "UPDATE answers SET last_used = ? WHERE key = ?", (time.time(), key)
+            )
+        return True, pickle.loads(row[0])
+
+    def store(self, key: str, day: int, part: int, input_path: str, answer: Any):
+        data = pickle.dumps(answer)
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, day, part, input_path, data, len(data), time.time()),
+            )
+            self.evict()
+
+    def evict(self) -> int:
+        """Removes least recently used answers until they fit in the size cap."""
+        (total_size,) = self.connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM answers"
+        ).fetchone()
+        evicted_keys = []
+        rows = self.connection.execute(
+            "SELECT key, size FROM answers ORDER BY last_used"
+        )
+        for key, size in rows:
+            if total_size <= self.max_bytes:
+                break
+            evicted_keys.append((key,))
+            total_size -= size
+        self.connection.executemany("DELETE FROM answers WHERE key = ?", evicted_keys)
+        return len(evicted_keys)
+
+    def entries(self) -> list[Entry]:
+        rows = self.connection.execute(
+            "SELECT day, part, input_path, answer, size, last_used FROM answers"
+            " ORDER BY last_used"
+        )
+        return [
+            Entry(day, part, input_path, pickle.loads(answer), size, last_used)
+            for day, part, input_path, answer, size, last_used in rows
+        ]
+
+    def purge(self, day: int | None = None) -> int:
+        """Removes the answers of a day, or all of them, and returns their count."""
+        with self.connection:
+            if day is None:
+                cursor = self.connection.execute("DELETE FROM answers")
+            else:
+                cursor = self.connection.execute(
+                    "DELETE FROM answers WHERE day = ?", (day,)
+                )
+        return cursor.rowcount
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--path", help="cache database (default: in the cache dir)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="list cached answers")
+    purge_parser = commands.add_parser("purge", help="remove cached answers")
+    purge_target = purge_parser.add_mutually_exclusive_group(required=True)
+    purge_target.add_argument("--day", type=int)
+    purge_target.add_argument("--all", action="store_true")
+    args = parser.parse_args(argv)
+
+    with AnswerCache(args.path) as cache:
+        match args.command:
+            case "list":
+                entries = cache.entries()
+                for entry in entries:
+                    last_used = time.strftime(
+                        "%Y-%m-%d %H:%M:%S", time.localtime(entry.last_used)
+                    )
+                    answer = str(entry.answer).replace("\n", " ")
+                    print(
+                        f"Day {entry.day:02d} part {entry.part}: {answer[:40]}"
+                        f" ({entry.input_path}, {entry.size}B, used {last_used})"
+                    )
+                total_size = sum(entry.size for entry in entries)
+                print(f"{len(entries)} answers, {total_size}B / {cache.max_bytes}B")
+            case "purge":
+                print(f"Removed {cache.purge(args.day)} answers")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Runs the solution of a day over many input files, e.g.:
+    python batch.py 14 inputs/                  # every file of a directory
+    python batch.py 14 "inputs/*.txt" -o results.jsonl
+    python batch.py 15 inputs/ --parts 1 --chunksize 32 --workers 8
+
+Inputs are spread over a pool of processes, each of them importing the solution
+once when it starts, so that the interpreter startup and import costs are paid
+once per process rather than once per input. Inputs are sent to the processes by
+chunks to reduce the inter-process communication overhead.
+
+Results are written as JSON lines (in the order of the inputs) as soon as they
+are available, e.g.:
+    {"input": "inputs/1", "answers": {"1": 24, "2": 93}, "parse_time": ..., ...}
+Inputs whose parsing or solving raised have an "error" instead of answers.
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Iterable, Iterator, TextIO
+
+from runner import PARTS, load_solution, run_part
+
+# Chunks per worker when the chunk size isn't given, small enough for the work to
+# stay balanced when some inputs take longer than others
+CHUNKS_PER_WORKER = 4
+
+
+def expand_inputs(patterns: Iterable[str]) -> list[str]:
+    """Input files of directories (non recursively) or glob patterns."""
+    paths = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            names = sorted(os.listdir(pattern))
+            candidates = [os.path.join(pattern, name) for name in names]
+        else:
+            candidates = sorted(glob.glob(pattern))
+        paths.extend(path for path in candidates if os.path.isfile(path))
+    return paths
+
+
+def solve_input(
+    day: int, input_path: str, parts: Iterable[int] = PARTS, cache: bool = False
+) -> dict[str, Any]:
+    record: dict[str, Any] = {"input": input_path}
+    answers = {}
+    parse_time = solve_time = 0.0
+    try:
+        for part in parts:
+            result = run_part(day, part, input_path, cache=cache)
+            answers[str(part)] = result.answer
+            parse_time += result.parse_time
+            solve_time += result.solve_time
+    except Exception as e:
+        # A broken input must not stop the whole batch
+        record["error"] = f"{type(e).__name__}: {e}"
+    else:
+        record["answers"] = answers
+    record["parse_time"] = parse_time
+    record["solve_time"] = solve_time
+    return record
+
+
+def default_chunksize(inputs_count: int, workers: int | None) -> int:
+    workers = workers or os.cpu_count() or 1
+    return max(1, inputs_count // (workers * CHUNKS_PER_WORKER))
+
+
+def run_batch(
+    day: int,
+    input_paths: list[str],
+    parts: Iterable[int] = PARTS,
+    workers: int | None = None,
+    chunksize: int | None = None,
+    cache: bool = False,
+) -> Iterator[dict[str, Any]]:
+    """Yields the record of each input, in the order of the inputs."""
+    chunksize = chunksize or default_chunksize(len(input_paths), workers)
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=load_solution, initargs=(day,)
+    ) as executor:
+        yield from executor.map(
+            partial(solve_input, day, parts=tuple(parts), cache=cache),
+            input_paths,
+            chunksize=chunksize,
+        )
+
+
+def json_default(value: Any) -> Any:
+    # NumPy scalars (e.g. answers computed on arrays) are converted to Python ones
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+def write_records(records: Iterable[dict[str, Any]], output: TextIO) -> int:
+    """Writes the records as JSON lines, and returns the count of errors."""
+    errors_count = 0
+    for record in records:
+        errors_count += "error" in record
+        output.write(json.dumps(record, default=json_default) + "\n")
+        output.flush()
+    return errors_count
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("day", type=int)
+    parser.add_argument(
+        "inputs", nargs="+", help="directories of input files or glob patterns"
+    )
+    parser.add_argument("-p", "--parts", nargs="+", type=int, default=list(PARTS))
+    parser.add_argument("-o", "--output", help="JSON lines file (default: stdout)")
+    parser.add_argument(
+        "-w", "--workers", type=int, help="number of processes (default: CPU count)"
+    )
+    parser.add_argument("-c", "--chunksize", type=int, help="inputs sent at once")
+    parser.add_argument(
+        "--cache", action="store_true", help="use and fill the answer cache"
+    )
+    args = parser.parse_args(argv)
+
+    input_paths = expand_inputs(args.inputs)
+    if not input_paths:
+        parser.error("no input files found")
+    start = time.perf_counter()
+    records = run_batch(
+        args.day,
+        input_paths,
+        parts=args.parts,
+        workers=args.workers,
+        chunksize=args.chunksize,
+        cache=args.cache,
+    )
+    if args.output:
+        with open(args.output, "w") as output:
+            errors_count = write_records(records, output)
+    else:
+        errors_count = write_records(records, sys.stdout)
+    print(
+        f"{len(input_paths)} inputs, {errors_count} errors"
+        f" in {time.perf_counter() - start:.3f}s",
+        file=sys.stderr,
+    )
+    return 1 if errors_count else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,228 @@
+"""
+Benchmarks the parsing and solving phases of each day's parts, e.g.:
+    python bench.py --save baseline.json      # record a baseline for all days
+    python bench.py 8 12 --compare baseline.json  # fails on regressions
+    python bench.py 14 --scaling small_input medium_input large_input
+    python bench.py 14 --generate 100 200 400  # generated inputs of these sizes
+
+Each phase is run a few times after warm-up runs, the median and 95th percentile
+times are reported. When scaling inputs are provided, the observed complexity
+exponent k (time ~ size^k, sizes being the input files sizes) is estimated for
+each phase.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import statistics
+import sys
+import tempfile
+import time
+from typing import Iterable, NamedTuple
+
+from generators import write_input
+from runner import day_dir, discover_days, get_parser, get_solver, load_solution
+
+PHASES = ("parse", "solve")
+DEFAULT_THRESHOLD = 0.2  # 20% slower than the baseline
+# Phases faster than this are too sensitive to noise to be compared
+DEFAULT_MIN_TIME = 0.001  # seconds
+
+
+class PhaseStats(NamedTuple):
+    median: float  # seconds
+    p95: float  # seconds
+    runs: int
+
+
+Results = dict[str, PhaseStats]  # keyed by "<day>.<part>.<phase>", e.g. "01.2.solve"
+
+
+def result_key(day: int, part: int, phase: str) -> str:
+    return f"{day:02d}.{part}.{phase}"
+
+
+def percentile(times: list[float], ratio: float) -> float:
+    ordered = sorted(times)
+    return ordered[max(math.ceil(ratio * len(ordered)) - 1, 0)]
+
+
+def time_part(
+    day: int, part: int, input_path: str, repeat: int = 5, warmup: int = 1
+) -> dict[str, list[float]]:
+    """
+    Times each phase of a part. The input is parsed again before each solving
+    since some solutions mutate their parsed input.
+    """
+    solution = load_solution(day)
+    parse, solve = get_parser(solution, part), get_solver(solution, part)
+    times: dict[str, list[float]] = {phase: [] for phase in PHASES}
+    for run in range(warmup + repeat):
+        start = time.perf_counter()
+        data = parse(input_path)
+        parsed = time.perf_counter()
+        solve(data)
+        solved = time.perf_counter()
+        if run >= warmup:
+            times["parse"].append(parsed - start)
+            times["solve"].append(solved - parsed)
+    return times
+
+
+def bench_days(
+    days: Iterable[int], parts: Iterable[int], repeat: int = 5, warmup: int = 1
+) -> Results:
+    results = {}
+    for day in days:
+        input_path = os.path.join(day_dir(day), "input")
+        for part in parts:
+            times = time_part(day, part, input_path, repeat=repeat, warmup=warmup)
+            for phase, phase_times in times.items():
+                results[result_key(day, part, phase)] = PhaseStats(
+                    median=statistics.median(phase_times),
+                    p95=percentile(phase_times, 0.95),
+                    runs=len(phase_times),
+                )
+    return results
+
+
+def find_regressions(
+    results: Results,
+    baseline: Results,
+    threshold: float = DEFAULT_THRESHOLD,
+    min_time: float = DEFAULT_MIN_TIME,
+) -> dict[str, tuple[float, float]]:
+    """
+    Returns the baseline and current median times of the phases that got slower
+    than the threshold allows.
+    """
+    return {
+        key: (baseline[key].median, stats.median)
+        for key, stats in results.items()
+        if key in baseline
+        and stats.median >= min_time
+        and stats.median > baseline[key].median * (1 + threshold)
+    }
+
+
+def save_results(results: Results, path: str) -> None:
+    with open(path, "w") as f:
+        json.dump({key: stats._asdict() for key, stats in results.items()}, f, indent=2)
+
+
+def load_results(path: str) -> Results:
+    with open(path) as f:
+        return {key: PhaseStats(**stats) for key, stats in json.load(f).items()}
+
+
+def complexity_exponent(sizes: list[float], times: list[float]) -> float:
+    """
+    Slope of the least squares fit of log(time) against log(size), i.e. k in
+    time ~ size^k.
+    """
+    log_sizes = [math.log(size) for size in sizes]
+    log_times = [math.log(max(t, 1e-9)) for t in times]
+    mean_size, mean_time = statistics.fmean(log_sizes), statistics.fmean(log_times)
+    covariance = sum(
+        (s - mean_size) * (t - mean_time) for s, t in zip(log_sizes, log_times)
+    )
+    variance = sum((s - mean_size) ** 2 for s in log_sizes)
+    return covariance / variance
+
+
+def measure_scaling(
+    day: int, part: int, input_paths: list[str], repeat: int = 3, warmup: int = 1
+) -> dict[str, tuple[list[tuple[int, float]], float]]:
+    """
+    Runs a part on inputs of increasing sizes and returns, for each phase, the
+    (input size, median time) measures along with the complexity exponent.
+    """
+    sizes = [os.path.getsize(path) for path in input_paths]
+    medians: dict[str, list[float]] = {phase: [] for phase in PHASES}
+    for path in input_paths:
+        times = time_part(day, part, path, repeat=repeat, warmup=warmup)
+        for phase in PHASES:
+            medians[phase].append(statistics.median(times[phase]))
+    return {
+        phase: (
+            list(zip(sizes, medians[phase])),
+            complexity_exponent(sizes, medians[phase]),
+        )
+        for phase in PHASES
+    }
+
+
+def print_scaling(
+    day: int, parts: Iterable[int], input_paths: list[str], repeat: int, warmup: int
+) -> None:
+    for part in parts:
+        scaling = measure_scaling(day, part, input_paths, repeat=repeat, warmup=warmup)
+        for phase, (measures, exponent) in scaling.items():
+            points = ", ".join(f"{size}B: {t:.4f}s" for size, t in measures)
+            print(f"{result_key(day, part, phase)}: ~size^{exponent:.2f} ({points})")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("days", nargs="*", type=int, help="days to run (default: all)")
+    parser.add_argument("-p", "--parts", nargs="+", type=int, default=[1, 2])
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument("-w", "--warmup", type=int, default=1)
+    parser.add_argument("--save", metavar="PATH", help="save results as a baseline")
+    parser.add_argument("--compare", metavar="PATH", help="baseline to compare to")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME)
+    parser.add_argument(
+        "--scaling",
+        nargs="+",
+        metavar="INPUT",
+        help="inputs of increasing sizes to estimate the complexity of a single day",
+    )
+    parser.add_argument(
+        "--generate",
+        nargs="+",
+        type=int,
+        metavar="SIZE",
+        help="same as --scaling with inputs generated for these sizes",
+    )
+    parser.add_argument("--seed", type=int, help="seed of the generated inputs")
+    args = parser.parse_args(argv)
+    days = args.days or discover_days()
+
+    if args.scaling or args.generate:
+        if len(days) != 1:
+            parser.error("--scaling and --generate require a single day")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            input_paths = args.scaling or []
+            for size in args.generate or ():
+                input_paths.append(os.path.join(tmp_dir, str(size)))
+                write_input(input_paths[-1], days[0], size, seed=args.seed)
+            print_scaling(days[0], args.parts, input_paths, args.repeat, args.warmup)
+        return 0
+
+    results = bench_days(days, args.parts, repeat=args.repeat, warmup=args.warmup)
+    for key, stats in results.items():
+        print(f"{key}: median {stats.median:.4f}s, p95 {stats.p95:.4f}s")
+    if args.save:
+        save_results(results, args.save)
+    if args.compare:
+        regressions = find_regressions(
+            results,
+            load_results(args.compare),
+            threshold=args.threshold,
+            min_time=args.min_time,
+        )
+        for key, (baseline_time, current_time) in regressions.items():
+            print(
+                f"Regression {key}: {baseline_time:.4f}s -> {current_time:.4f}s",
+                file=sys.stderr,
+            )
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""
+Checks that importing each day's solution stays within a time budget, e.g.:
+    python check_startup.py                  # all days
+    python check_startup.py 8 12 --budget 30  # some days, budget in milliseconds
+
+Solutions are imported in fresh interpreters with -X importtime, the cumulative
+import time of the solution module (i.e. including all the modules it imports
+that weren't already imported by the interpreter startup) is compared to the
+budget. The median of a few runs is kept since a single run is noisy, after a
+first run writing the bytecode cache.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+from runner import ROOT_DIR, day_dir, discover_days
+
+DEFAULT_BUDGET_MS = 10.0
+# Days working on NumPy arrays can't avoid importing it
+BUDGETS_MS = {8: 120.0, 12: 120.0}
+IMPORT_TIME_PATTERN = re.compile(r"import time:\s+\d+ \|\s+(\d+) \| solution$", re.M)
+
+
+def import_time(day: int) -> float:
+    """Cumulative import time of the solution of a day, in milliseconds."""
+    env = dict(os.environ)
+    # Like when the project is installed, utils is importable from anywhere
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, (ROOT_DIR, env.get("PYTHONPATH"))))
+    # Compiling modules would dominate the import time, it's measured with the
+    # bytecode cached by a previous run as it is in normal use
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import solution"],
+        cwd=day_dir(day),
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    match = IMPORT_TIME_PATTERN.search(process.stderr)
+    if match is None:
+        raise ValueError(f"No import time reported for day {day}")
+    return int(match.group(1)) / 1000
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "days", nargs="*", type=int, help="days to check (default: all)"
+    )
+    parser.add_argument(
+        "--budget", type=float, help="budget in milliseconds (default: per day)"
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    over_budget = False
+    for day in args.days or discover_days():
+        budget = args.budget or BUDGETS_MS.get(day, DEFAULT_BUDGET_MS)
+        import_time(day)  # Warm up the bytecode cache
+        median = statistics.median(import_time(day) for _ in range(args.repeat))
+        status = "OK" if median <= budget else "OVER BUDGET"
+        over_budget |= median > budget
+        print(f"Day {day:02d}: {median:.1f}ms (budget {budget:.0f}ms) {status}")
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
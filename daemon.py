@@ -0,0 +1,240 @@
+"""
+Serves the solutions from a long-running process, e.g.:
+    python daemon.py serve --cache-size 256  # listens on a Unix socket
+    python daemon.py solve 14 day-14/input  # same output as python solution.py
+    python daemon.py serve --port 8022      # or on a localhost TCP port
+    python daemon.py solve 14 day-14/input --part 2 --port 8022
+
+The daemon imports every solution once in each process of its pool when
+starting, so requests don't pay the interpreter startup and imports. With a
+cache size, the answers of the most recently solved inputs are kept in memory.
+
+Requests and responses are JSON lines, several requests can be sent on a
+connection:
+    {"day": 14, "parts": [1, 2], "input": "498,4 -> 498,6 -> 496,6\\n..."}
+    {"answers": {"1": 24, "2": 93}, "cached": false}
+Failed requests get an {"error": "..."} response instead.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from utils import cache_dir, pretty_print
+
+# The client is meant to start quickly, the modules only needed to solve
+# (runner, batch, concurrent.futures) are imported by the server functions
+PARTS = (1, 2)
+DEFAULT_SOCKET_PATH = os.path.join(cache_dir("daemon"), "daemon.sock")
+
+
+def preload_solutions() -> None:
+    from runner import discover_days, load_solution
+
+    for day in discover_days():
+        load_solution(day)
+
+
+def solve_content(day: int, part: int, content: bytes) -> Any:
+    """Solves a part for an input content, written to a file for the parser."""
+    from runner import run_part
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "input")
+        with open(path, "wb") as f:
+            f.write(content)
+        return run_part(day, part, path).answer
+
+
+class SolverServerMixin:
+    """Answers requests from a pool of processes, caching the latest answers."""
+
+    daemon_threads = True
+
+    def setup_solvers(self, workers: int | None = None, cache_size: int = 0):
+        from concurrent.futures import ProcessPoolExecutor
+
+        from runner import discover_days
+
+        self.days = discover_days()
+        self.executor = ProcessPoolExecutor(
+            max_workers=workers, initializer=preload_solutions
+        )
+        self.cache_size = cache_size
+        self.cached_answers: OrderedDict[str, Any] = OrderedDict()
+        self.cache_lock = threading.Lock()
+
+    def answer(self, request: dict[str, Any]) -> dict[str, Any]:
+        day = request.get("day")
+        parts = request.get("parts") or PARTS
+        if day not in self.days or not set(parts) <= set(PARTS):
+            return {"error": f"Unknown day or parts: {day} {parts}"}
+        content = request.get("input", "").encode()
+        digest = hashlib.sha256(content).hexdigest()
+        keys = {part: f"{day}.{part}.{digest}" for part in parts}
+        answers, futures = {}, {}
+        with self.cache_lock:
+            for part, key in keys.items():
+                if key in self.cached_answers:
+                    self.cached_answers.move_to_end(key)
+                    answers[part] = self.cached_answers[key]
+        for part in parts:
+            if part not in answers:
+                futures[part] = self.executor.submit(solve_content, day, part, content)
+        try:
+            for part, future in futures.items():
+                answers[part] = future.result()
+        except Exception as e:
+            return {"error": f"{type(e).__name__}: {e}"}
+        if self.cache_size:
+            with self.cache_lock:
+                for part in futures:
+                    self.cached_answers[keys[part]] = answers[part]
+                while len(self.cached_answers) > self.cache_size:
+                    self.cached_answers.popitem(last=False)
+        return {
+            "answers": {str(part): answers[part] for part in parts},
+            "cached": not futures,
+        }
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.executor.shutdown(cancel_futures=True)
+
+
+class UnixSolverServer(SolverServerMixin, socketserver.ThreadingUnixStreamServer):
+    def server_close(self) -> None:
+        super().server_close()
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+
+
+class TCPSolverServer(SolverServerMixin, socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        from batch import json_default
+
+        for line in self.rfile:
+            try:
+                response = self.server.answer(json.loads(line))
+            except (ValueError, AttributeError, TypeError) as e:
+                response = {"error": f"Invalid request: {e}"}
+            self.wfile.write(
+                (json.dumps(response, default=json_default) + "\n").encode()
+            )
+
+
+def make_server(
+    socket_path: str | None = None,
+    port: int | None = None,
+    workers: int | None = None,
+    cache_size: int = 0,
+) -> UnixSolverServer | TCPSolverServer:
+    """Server listening on a localhost port if given, on a Unix socket otherwise."""
+    if port is not None:
+        server = TCPSolverServer(("127.0.0.1", port), RequestHandler)
+    else:
+        socket_path = socket_path or DEFAULT_SOCKET_PATH
+        os.makedirs(os.path.dirname(socket_path), exist_ok=True)
+        # Left behind by a daemon that didn't stop cleanly
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        server = UnixSolverServer(socket_path, RequestHandler)
+    server.setup_solvers(workers=workers, cache_size=cache_size)
+    return server
+
+
+def connect(socket_path: str | None = None, port: int | None = None) -> socket.socket:
+    if port is not None:
+        return socket.create_connection(("127.0.0.1", port))
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(socket_path or DEFAULT_SOCKET_PATH)
+    except OSError:
+        client.close()
+        raise
+    return client
+
+
+def send_request(client: socket.socket, request: dict[str, Any]) -> dict[str, Any]:
+    with client.makefile("rwb") as stream:
+        stream.write((json.dumps(request) + "\n").encode())
+        stream.flush()
+        return json.loads(stream.readline())
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    address_parser = argparse.ArgumentParser(add_help=False)
+    address_parser.add_argument(
+        "--socket", help="Unix socket (default: in the cache dir)"
+    )
+    address_parser.add_argument(
+        "--port", type=int, help="localhost TCP port to use instead"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve_parser = commands.add_parser(
+        "serve", parents=[address_parser], help="start the daemon"
+    )
+    serve_parser.add_argument(
+        "-w", "--workers", type=int, help="number of processes (default: CPU count)"
+    )
+    serve_parser.add_argument(
+        "--cache-size", type=int, default=0, help="answers kept in memory"
+    )
+    solve_parser = commands.add_parser(
+        "solve", parents=[address_parser], help="solve an input with the daemon"
+    )
+    solve_parser.add_argument("day", type=int)
+    solve_parser.add_argument("input", nargs="?", default="./input")
+    solve_parser.add_argument("-p", "--part", type=int, choices=PARTS)
+    args = parser.parse_args(argv)
+
+    match args.command:
+        case "serve":
+            with make_server(
+                args.socket, args.port, args.workers, args.cache_size
+            ) as server:
+                address = args.socket or DEFAULT_SOCKET_PATH
+                address = address if args.port is None else f"port {args.port}"
+                print(f"Serving days {server.days} on {address}", file=sys.stderr)
+                try:
+                    server.serve_forever()
+                except KeyboardInterrupt:
+                    pass
+            return 0
+        case "solve":
+            with open(args.input) as f:
+                content = f.read()
+            parts = [args.part] if args.part else list(PARTS)
+            try:
+                with connect(args.socket, args.port) as client:
+                    response = send_request(
+                        client, {"day": args.day, "parts": parts, "input": content}
+                    )
+            except OSError as e:
+                print(f"No daemon to connect to ({e})", file=sys.stderr)
+                return 1
+            if "error" in response:
+                print(response["error"], file=sys.stderr)
+                return 1
+            for part, answer in response["answers"].items():
+                pretty_print(f"Part {part}:", answer)
+            return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,11 @@
-import os
-import sys
+from __future__ import annotations
 
-sys.path.append(os.path.abspath(os.path.join("..")))
+import heapq
+from functools import partial
+from itertools import chain
+from typing import Iterable
 
-from utils import parse_input
+from utils import chunk_ranges, parse_input
 
 
 Snack = tuple[int, ...]
@@ -13,20 +15,104 @@ def parse_snacks(line: str) -> Snack:
     return tuple(int(w) for w in line.split("\n"))
 
 
+def parse(path: str = "./input") -> tuple[Snack, ...]:
+    return parse_input(path, sep="\n\n", parse_fn=parse_snacks)
+
+
 def calories_from_snack(snack: Snack) -> int:
     return sum(snack)
 
 
-def greatest_total_calories(snacks: tuple[Snack]) -> int:
+def greatest_total_calories(snacks: Iterable[Snack]) -> int:
     return max(calories_from_snack(snack) for snack in snacks)
 
 
-def top_three_total_calories(snacks: tuple[Snack]) -> int:
-    snacks_calories = tuple(calories_from_snack(snack) for snack in snacks)
-    return sum(sorted(snacks_calories, reverse=True)[:3])
+def top_total_calories(snacks: Iterable[Snack], k: int = 3) -> int:
+    """Total calories of the k elves carrying the most, keeping only k totals."""
+    return sum(heapq.nlargest(k, (calories_from_snack(snack) for snack in snacks)))
+
+
+def chunk_top_calories(path: str, chunk_range: tuple[int, int], k: int) -> list[int]:
+    """Calories of the k elves carrying the most in a chunk of the input file."""
+    import numpy as np
+
+    start, end = chunk_range
+    with open(path, "rb") as f:
+        f.seek(start)
+        content = f.read(end - start).replace(b"\r\n", b"\n").rstrip()
+    if not content:
+        return []
+    # Blank lines between elves are replaced by a marker (calories are positive)
+    # so that all the snacks of the chunk are parsed at once
+    snacks = np.fromstring(
+        content.replace(b"\n\n", b"\n-1\n"), dtype=np.int64, sep="\n"
+    )
+    markers = np.flatnonzero(snacks == -1)
+    snacks[markers] = 0
+    totals = np.add.reduceat(snacks, np.concatenate(([0], markers + 1)))
+    if len(totals) > k:
+        totals = totals[np.argpartition(totals, -k)[-k:]]
+    return totals.tolist()
+
+
+def stream_top_calories(
+    path: str = "./input",
+    k: int = 3,
+    chunk_size: int = 1 << 24,
+    workers: int | None = 1,
+) -> list[int]:
+    """
+    Calories of the k elves carrying the most, in decreasing order, computed
+    from the input file without parsing it all at once: the file is processed
+    by chunks of whole elves, only keeping the top k of each chunk. Chunks are
+    spread over several processes unless workers is 1 (None for one process per
+    CPU).
+    """
+    # Elves are separated by blank lines, of either Unix or Windows line endings
+    with open(path, "rb") as f:
+        newline = "\r\n" if f.readline().endswith(b"\r\n") else "\n"
+    chunks = chunk_ranges(path, sep=newline * 2, chunk_size=chunk_size)
+    chunk_top = partial(chunk_top_calories, path, k=k)
+    if workers == 1:
+        return heapq.nlargest(k, chain.from_iterable(map(chunk_top, chunks)))
+    # Imported here since it takes longer than running the solution on the input
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return heapq.nlargest(k, chain.from_iterable(executor.map(chunk_top, chunks)))
+
+
+def solve_part_1(snacks: tuple[Snack]) -> int:
+    return greatest_total_calories(snacks)
+
+
+def solve_part_2(snacks: tuple[Snack], k: int = 3) -> int:
+    return top_total_calories(snacks, k=k)
 
 
 if __name__ == "__main__":
-    data = parse_input(sep="\n\n", parse_fn=parse_snacks)
-    print("Part 1:", greatest_total_calories(data))
-    print("Part 2:", top_three_total_calories(data))
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("input", nargs="?", default="./input")
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="process the input by chunks instead of parsing it all at once",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="processes used with --stream (0 for one per CPU)",
+    )
+    args = parser.parse_args()
+    if args.stream:
+        top_calories = stream_top_calories(args.input, workers=args.workers or None)
+        print("Part 1:", max(top_calories, default=0))
+        print("Part 2:", sum(top_calories))
+    else:
+        snacks = parse(args.input)
+        print("Part 1:", solve_part_1(snacks))
+        print("Part 2:", solve_part_2(snacks))
@@ -1,4 +1,5 @@
 import os
+import tempfile
 import unittest
 import sys
 
@@ -8,7 +9,8 @@ from utils import parse_input
 from solution import (
     parse_snacks,
     greatest_total_calories,
-    top_three_total_calories,
+    stream_top_calories,
+    top_total_calories,
 )
 
 
@@ -21,7 +23,29 @@ class TestDay1(unittest.TestCase):
         self.assertEqual(greatest_total_calories(self.data), 24000)
 
     def test_part_2(self):
-        self.assertEqual(top_three_total_calories(self.data), 45000)
+        self.assertEqual(top_total_calories(self.data), 45000)
+        self.assertEqual(top_total_calories(self.data, k=1), 24000)
+
+    def test_stream_top_calories(self):
+        self.assertEqual(stream_top_calories("test_input"), [24000, 11000, 10000])
+        # Chunks of a few elves, processed in parallel or not
+        for workers in (1, 2):
+            self.assertEqual(
+                stream_top_calories("test_input", k=2, chunk_size=10, workers=workers),
+                [24000, 11000],
+            )
+
+    def test_stream_top_calories_crlf(self):
+        with open("test_input", "rb") as f:
+            content = f.read().replace(b"\n", b"\r\n")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "input")
+            with open(path, "wb") as f:
+                f.write(content)
+            self.assertEqual(stream_top_calories(path), [24000, 11000, 10000])
+            self.assertEqual(
+                stream_top_calories(path, k=2, chunk_size=10), [24000, 11000]
+            )
 
 
 if __name__ == "__main__":
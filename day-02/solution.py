@@ -1,13 +1,8 @@
 from __future__ import annotations
 
-import os
-import sys
+from collections import Counter
 from enum import IntEnum
-from typing import Iterable
-
-sys.path.append(os.path.abspath(os.path.join("..")))
-
-from utils import parse_input
+from typing import Callable, Iterable
 
 
 class TurnOutcome(IntEnum):
@@ -68,6 +63,12 @@ class PlayerChoice(IntEnum):
 
 TurnChoices = tuple[PlayerChoice, PlayerChoice]
 TurnStrategy = tuple[PlayerChoice, TurnOutcome]
+# Indexed by the opponent choice (A, B, C) then by the second column (X, Y, Z)
+TurnsCounts = tuple[tuple[int, int, int], ...]
+ScoreTable = tuple[tuple[int, int, int], ...]
+
+OPPONENT_CHARS = "ABC"
+SECOND_CHARS = "XYZ"
 
 
 def parse_turn_choices(line: str) -> TurnChoices:
@@ -99,9 +100,74 @@ def total_score_from_turns_choices(turns: Iterable[TurnChoices]) -> int:
     return sum(score_from_turn_choices(turn) for turn in turns)
 
 
+def score_table(score_line: Callable[[str], int]) -> ScoreTable:
+    return tuple(
+        tuple(score_line(f"{opponent} {second}") for second in SECOND_CHARS)
+        for opponent in OPPONENT_CHARS
+    )
+
+
+# Scores of the 9 possible lines, the second column being either our choice
+# (part 1) or the outcome of the turn (part 2)
+CHOICES_SCORES = score_table(
+    lambda line: score_from_turn_choices(parse_turn_choices(line))
+)
+STRATEGY_SCORES = score_table(
+    lambda line: score_from_turn_choices(
+        turn_choices_from_strategy(parse_turn_strategy(line))
+    )
+)
+
+
+def count_turns(content: bytes) -> TurnsCounts:
+    """
+    Occurrences of each of the 9 possible lines in the strategy guide, counted in
+    a single pass over the lines.
+    """
+    content = content.replace(b"\r\n", b"\n").rstrip()
+    if content:
+        content += b"\n"
+    # Every line is 4 bytes long: a choice, a space, a second column and a newline
+    lines_count = len(content) // 4
+    if (
+        len(content) % 4
+        or content[1::4] != b" " * lines_count
+        or content[3::4] != b"\n" * lines_count
+    ):
+        raise ValueError("Lines of the strategy guide must be 3 characters long")
+    lines_counts = Counter(zip(content[0::4], content[2::4]))
+    counts = tuple(
+        tuple(lines_counts[opponent, second] for second in SECOND_CHARS.encode())
+        for opponent in OPPONENT_CHARS.encode()
+    )
+    if sum(map(sum, counts)) != lines_count:
+        raise ValueError("Unexpected lines in the strategy guide")
+    return counts
+
+
+def parse(path: str = "./input") -> TurnsCounts:
+    """Both parts are solved from the occurrences of each line."""
+    with open(path, "rb") as f:
+        return count_turns(f.read())
+
+
+def total_score(turns_counts: TurnsCounts, scores: ScoreTable) -> int:
+    return sum(
+        count * score
+        for counts_row, scores_row in zip(turns_counts, scores)
+        for count, score in zip(counts_row, scores_row)
+    )
+
+
+def solve_part_1(turns_counts: TurnsCounts) -> int:
+    return total_score(turns_counts, CHOICES_SCORES)
+
+
+def solve_part_2(turns_counts: TurnsCounts) -> int:
+    return total_score(turns_counts, STRATEGY_SCORES)
+
+
 if __name__ == "__main__":
-    turns_choices = parse_input(sep="\n", parse_fn=parse_turn_choices)
-    print("Part 1:", total_score_from_turns_choices(turns_choices))
-    turns_strategies = parse_input(sep="\n", parse_fn=parse_turn_strategy)
-    turns_choices = (turn_choices_from_strategy(s) for s in turns_strategies)
-    print("Part 2:", total_score_from_turns_choices(turns_choices))
+    turns_counts = parse()
+    print("Part 1:", solve_part_1(turns_counts))
+    print("Part 2:", solve_part_2(turns_counts))
@@ -6,9 +6,12 @@ sys.path.append(os.path.abspath(os.path.join("..")))
 
 from utils import parse_input
 from solution import (
-    parse_input,
+    count_turns,
+    parse,
     parse_turn_choices,
     parse_turn_strategy,
+    solve_part_1,
+    solve_part_2,
     turn_choices_from_strategy,
     total_score_from_turns_choices,
 )
@@ -28,6 +31,24 @@ class TestDay1(unittest.TestCase):
         turns_choices = (turn_choices_from_strategy(s) for s in turns_strategies)
         self.assertEqual(total_score_from_turns_choices(turns_choices), 12)
 
+    def test_turns_counts(self):
+        turns_counts = parse("test_input")
+        self.assertEqual(turns_counts, ((0, 1, 0), (1, 0, 0), (0, 0, 1)))
+        self.assertEqual(solve_part_1(turns_counts), 15)
+        self.assertEqual(solve_part_2(turns_counts), 12)
+        self.assertEqual(count_turns(b""), ((0, 0, 0),) * 3)
+        self.assertEqual(
+            count_turns(b"A Y\r\nB X\r\n"), ((0, 1, 0), (1, 0, 0), (0, 0, 0))
+        )
+        for content in (
+            b"A Y\nA W\n",
+            b"AA Y\n",
+            b"A Y \nB X\n",
+            b"\n\nA YB YC Z",
+        ):
+            with self.subTest(content=content), self.assertRaises(ValueError):
+                count_turns(content)
+
 
 if __name__ == "__main__":
     unittest.main()
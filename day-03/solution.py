@@ -1,59 +1,63 @@
 from __future__ import annotations
 
-import os
 import string
-import sys
-from typing import Generator, Iterable
+from typing import Iterable
 
-sys.path.append(os.path.abspath(os.path.join("..")))
+from utils import iter_input, mask_from_chars, parse_input
 
-from utils import batchify, parse_input
-
-Rucksack = tuple[str, ...]
-RucksackContent = set[str]
+# Items of a rucksack (or of a compartment) are stored as a mask, the bit of each
+# item being given by LETTERS_BITS: "a" is bit 0, ..., "Z" is bit 51.
+RucksackContent = int
 RucksackCompartments = tuple[RucksackContent, RucksackContent]
 
-
-ITEMS_PRIORITIES = tuple(string.ascii_letters)
+ALL_ITEMS = mask_from_chars(string.ascii_letters)
+GROUP_SIZE = 3
 
 
-def split_rucksack_content(line: str) -> tuple[RucksackContent, RucksackContent]:
-    items = tuple(line)
-    return set(items[: len(items) // 2]), set(items[len(items) // 2 :])
+def split_rucksack_content(line: str) -> RucksackCompartments:
+    half = len(line) // 2
+    return mask_from_chars(line[:half]), mask_from_chars(line[half:])
 
 
-def yield_groups(
-    lines: tuple[Rucksack, ...]
-) -> Generator[tuple[RucksackContent, ...], None, None]:
-    for group in batchify(lines, batch_size=3):
-        yield tuple(set(line) for line in group)
+def parse(path: str = "./input") -> tuple[RucksackCompartments, ...]:
+    return parse_input(path, parse_fn=split_rucksack_content)
 
 
-def find_common_item(sets: Iterable[RucksackContent]) -> str:
-    head, *tail = sets
-    for s in tail:
-        head = head.intersection(s)
-    return next(iter(head))
+def priority_from_items(items: RucksackContent) -> int:
+    """Priority of the single item of a mask, i.e. its bit index plus one."""
+    return items.bit_length()
 
 
-def priority_from_item(item: str) -> int:
-    return ITEMS_PRIORITIES.index(item) + 1
+def priorities_sums(rucksacks: Iterable[RucksackCompartments]) -> tuple[int, int]:
+    """
+    Sums of the priorities of the items in both compartments of each rucksack
+    and of the badges of each group of rucksacks, in a single pass.
+    """
+    misplaced_items_sum = badges_sum = 0
+    group_items = ALL_ITEMS
+    for idx, (first, second) in enumerate(rucksacks, start=1):
+        misplaced_items_sum += priority_from_items(first & second)
+        group_items &= first | second
+        if idx % GROUP_SIZE == 0:
+            badges_sum += priority_from_items(group_items)
+            group_items = ALL_ITEMS
+    return misplaced_items_sum, badges_sum
 
 
-def solve_part_1(rucksacks_contents: tuple[RucksackCompartments]) -> int:
-    common_items = (find_common_item(content) for content in rucksacks_contents)
-    priorities_sum = sum(priority_from_item(item) for item in common_items)
-    return priorities_sum
+def solve_part_1(rucksacks: Iterable[RucksackCompartments]) -> int:
+    misplaced_items_sum, _ = priorities_sums(rucksacks)
+    return misplaced_items_sum
 
 
-def solve_part_2(rucksacks: tuple[Rucksack]) -> int:
-    common_items = (find_common_item(group) for group in yield_groups(rucksacks))
-    priorities_sum = sum(priority_from_item(item) for item in common_items)
-    return priorities_sum
+def solve_part_2(rucksacks: Iterable[RucksackCompartments]) -> int:
+    _, badges_sum = priorities_sums(rucksacks)
+    return badges_sum
 
 
 if __name__ == "__main__":
-    rucksacks_contents = parse_input(parse_fn=split_rucksack_content)
-    print("Part 1:", solve_part_1(rucksacks_contents))
-    all_rucksacks = parse_input(parse_fn=tuple)
-    print("Part 2:", solve_part_2(all_rucksacks))
+    # Both parts in a single pass over the input, without storing it
+    misplaced_items_sum, badges_sum = priorities_sums(
+        iter_input(parse_fn=split_rucksack_content)
+    )
+    print("Part 1:", misplaced_items_sum)
+    print("Part 2:", badges_sum)
@@ -4,8 +4,14 @@ import sys
 
 sys.path.append(os.path.abspath(os.path.join("..")))
 
-from solution import split_rucksack_content, solve_part_1, solve_part_2
-from utils import parse_input
+from solution import (
+    priorities_sums,
+    priority_from_items,
+    solve_part_1,
+    solve_part_2,
+    split_rucksack_content,
+)
+from utils import iter_input, mask_from_chars, parse_input
 
 
 class TestDay1(unittest.TestCase):
@@ -14,8 +20,14 @@ class TestDay1(unittest.TestCase):
         self.assertEqual(solve_part_1(rucksacks_contents), 157)
 
     def test_part_2(self):
-        all_rucksacks = parse_input("test_input", parse_fn=tuple)
-        self.assertEqual(solve_part_2(all_rucksacks), 70)
+        rucksacks_contents = parse_input("test_input", parse_fn=split_rucksack_content)
+        self.assertEqual(solve_part_2(rucksacks_contents), 70)
+
+    def test_priorities_sums(self):
+        rucksacks = iter_input("test_input", parse_fn=split_rucksack_content)
+        self.assertEqual(priorities_sums(rucksacks), (157, 70))
+        self.assertEqual(priority_from_items(mask_from_chars("p")), 16)
+        self.assertEqual(priority_from_items(mask_from_chars("L")), 38)
 
 
 if __name__ == "__main__":
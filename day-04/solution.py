@@ -1,14 +1,23 @@
 from __future__ import annotations
 
-import os
-import sys
+import re
+from typing import TYPE_CHECKING, Sequence
 
-sys.path.append(os.path.abspath(os.path.join("..")))
+from utils import Interval, IntervalSet, reshape
 
-from utils import count_if, parse_input
+if TYPE_CHECKING:
+    import numpy as np
 
 Assignment = tuple[int, int]
 AssignmentsPair = tuple[Assignment, Assignment]
+# Sections of all the pairs, as first start, first end, second start and second
+# end columns
+AssignmentsColumns = tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray"]
+
+# Sections are parsed all at once as whitespace separated integers, once every
+# line has been checked to be made of two ranges of sections
+SECTIONS_SEPARATORS = bytes.maketrans(b"-,", b"  ")
+PAIRS_PATTERN = re.compile(rb"(?:\d+-\d+,\d+-\d+\n)*")
 
 
 def parse_assignments_pair(line: str) -> AssignmentsPair:
@@ -18,37 +27,168 @@ def parse_assignments_pair(line: str) -> AssignmentsPair:
     )
 
 
-def are_pairs_inclusive(assignments_pair: AssignmentsPair) -> bool:
-    (first_start, first_end), (second_start, second_end) = assignments_pair
+def parse(path: str = "./input") -> np.ndarray:
+    """Sections of the pairs as a (n, 4) array, one row per line."""
+    import numpy as np
+
+    with open(path, "rb") as f:
+        content = f.read().replace(b"\r\n", b"\n").rstrip()
+    if content:
+        content += b"\n"
+    if not PAIRS_PATTERN.fullmatch(content):
+        raise ValueError("Lines must be made of two ranges of sections")
+    sections = np.fromstring(
+        content.translate(SECTIONS_SEPARATORS), dtype=np.int64, sep=" "
+    )
+    return reshape(sections, width=4)
+
+
+def assignments_columns(
+    pairs: Sequence[AssignmentsPair] | np.ndarray,
+) -> AssignmentsColumns:
+    """Columns of the pairs, parsed either as an array or as AssignmentsPair."""
+    return tuple(reshape(pairs, width=4).T)
+
+
+def are_pairs_inclusive(columns: AssignmentsColumns) -> np.ndarray:
+    first_start, first_end, second_start, second_end = columns
     # Pairs are inclusive if
     return (
         # The first pair is contained by the second pair
-        (first_start >= second_start and first_end <= second_end)
+        ((first_start >= second_start) & (first_end <= second_end))
         # The second pair is contained by the first pair
-        or (second_start >= first_start and second_end <= first_end)
+        | ((second_start >= first_start) & (second_end <= first_end))
     )
 
 
-def do_pairs_overlap(assignments_pair: AssignmentsPair) -> bool:
-    (first_start, first_end), (second_start, second_end) = assignments_pair
+def do_pairs_overlap(columns: AssignmentsColumns) -> np.ndarray:
+    first_start, first_end, second_start, second_end = columns
     # Pairs overlap if they're not fully separated, i.e.:
     return (
         # The first pair is not before the second pair
-        not first_end < second_start
+        (first_end >= second_start)
         # The first pair is not after second pair
-        and not first_start > second_end
+        & (first_start <= second_end)
     )
 
 
-def solve_part_1(pairs: tuple[Assignment, ...]) -> int:
-    return count_if(pairs, predicate=are_pairs_inclusive)
+def count_inclusive_and_overlapping(
+    pairs: Sequence[AssignmentsPair] | np.ndarray,
+) -> tuple[int, int]:
+    columns = assignments_columns(pairs)
+    return (
+        int(are_pairs_inclusive(columns).sum()),
+        int(do_pairs_overlap(columns).sum()),
+    )
+
+
+def elves_assignments(
+    pairs: Sequence[AssignmentsPair] | np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Starts and ends of the assignments of every elf, elves 2 * i and 2 * i + 1
+    being the elves of the i-th pair.
+    """
+    starts, ends = reshape(pairs, width=2).T
+    return starts, ends
+
+
+def sorted_assignments(
+    pairs: Sequence[AssignmentsPair] | np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Elves sorted by the start of their assignments, along with the starts, the
+    ends and the running maximum of the ends of the sorted assignments.
+    """
+    import numpy as np
+
+    starts, ends = elves_assignments(pairs)
+    order = np.argsort(starts)
+    sorted_ends = ends[order]
+    return order, starts[order], sorted_ends, np.maximum.accumulate(sorted_ends)
+
+
+def overlapping_elves(pairs: Sequence[AssignmentsPair] | np.ndarray) -> np.ndarray:
+    """Elves whose assignment overlaps the assignment of any other elf."""
+    import numpy as np
+
+    order, sorted_starts, sorted_ends, max_ends = sorted_assignments(pairs)
+    # Once sorted by start, an assignment overlaps one starting before it if any
+    # of them ends after its start, and one starting after it if the next one
+    # starts before its end.
+    previous_max_ends = np.concatenate(([sorted_starts.min(initial=0) - 1], max_ends))
+    next_starts = np.concatenate((sorted_starts[1:], [sorted_ends.max(initial=0) + 1]))
+    overlaps_previous = previous_max_ends[:-1] >= sorted_starts
+    overlaps_next = next_starts <= sorted_ends
+    return np.sort(order[overlaps_previous | overlaps_next])
+
+
+def max_concurrent_coverage(
+    pairs: Sequence[AssignmentsPair] | np.ndarray,
+) -> tuple[int, int]:
+    """
+    Maximum number of elves assigned to a same section, along with the first
+    section having that many elves.
+    """
+    import numpy as np
+
+    starts, ends = elves_assignments(pairs)
+    if not len(starts):
+        return 0, 0
+    # The count is the highest at the start of an assignment, where it's the
+    # count of assignments started so far minus the ones ended before it.
+    starts, past_ends = np.sort(starts), np.sort(ends + 1)
+    elves_counts = np.arange(1, len(starts) + 1) - np.searchsorted(
+        past_ends, starts, side="right"
+    )
+    max_idx = int(np.argmax(elves_counts))
+    return int(elves_counts[max_idx]), int(starts[max_idx])
+
+
+def covered_sections(pairs: Sequence[AssignmentsPair] | np.ndarray) -> IntervalSet:
+    """Sections assigned to at least one elf."""
+    import numpy as np
+
+    order, sorted_starts, _, max_ends = sorted_assignments(pairs)
+    if not len(order):
+        return IntervalSet()
+    # Sorted assignments are merged with the previous ones until one starts past
+    # all the previous ones (and isn't adjacent to them), so that the set is only
+    # fed disjoint intervals.
+    is_new_interval = np.concatenate(([True], sorted_starts[1:] > max_ends[:-1] + 1))
+    new_interval_idx = np.flatnonzero(is_new_interval)
+    intervals_ends = max_ends[np.append(new_interval_idx[1:] - 1, len(order) - 1)]
+    return IntervalSet(
+        zip(sorted_starts[new_interval_idx].tolist(), intervals_ends.tolist())
+    )
+
+
+def uncovered_sections(
+    pairs: Sequence[AssignmentsPair] | np.ndarray,
+    first_section: int = 1,
+    last_section: int | None = None,
+) -> list[Interval]:
+    """
+    Ranges of sections assigned to no elf between the first and last sections
+    (the last assigned section by default).
+    """
+    coverage = covered_sections(pairs)
+    if last_section is None:
+        last_section = max((end for _, end in coverage), default=first_section - 1)
+    return list(coverage.gaps(first_section, last_section))
+
+
+def solve_part_1(pairs: Sequence[AssignmentsPair] | np.ndarray) -> int:
+    inclusive_count, _ = count_inclusive_and_overlapping(pairs)
+    return inclusive_count
 
 
-def solve_part_2(pairs: tuple[Assignment, ...]) -> int:
-    return count_if(pairs, predicate=do_pairs_overlap)
+def solve_part_2(pairs: Sequence[AssignmentsPair] | np.ndarray) -> int:
+    _, overlapping_count = count_inclusive_and_overlapping(pairs)
+    return overlapping_count
 
 
 if __name__ == "__main__":
-    assignments_pairs = parse_input(parse_fn=parse_assignments_pair)
-    print("Part 1:", solve_part_1(assignments_pairs))
-    print("Part 2:", solve_part_2(assignments_pairs))
+    inclusive_count, overlapping_count = count_inclusive_and_overlapping(parse())
+    print("Part 1:", inclusive_count)
+    print("Part 2:", overlapping_count)
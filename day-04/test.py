@@ -1,10 +1,21 @@
 import os
+import random
+import tempfile
 import unittest
 import sys
 
 sys.path.append(os.path.abspath(os.path.join("..")))
 
-from solution import parse_assignments_pair, solve_part_1, solve_part_2
+from solution import (
+    count_inclusive_and_overlapping,
+    max_concurrent_coverage,
+    overlapping_elves,
+    parse,
+    parse_assignments_pair,
+    solve_part_1,
+    solve_part_2,
+    uncovered_sections,
+)
 from utils import parse_input
 
 
@@ -17,6 +28,67 @@ class TestDay1(unittest.TestCase):
         assignments_pairs = parse_input("test_input", parse_fn=parse_assignments_pair)
         self.assertEqual(solve_part_2(assignments_pairs), 4)
 
+    def test_columns(self):
+        sections = parse("test_input")
+        self.assertEqual(sections.shape, (6, 4))
+        self.assertEqual(sections[0].tolist(), [2, 4, 6, 8])
+        self.assertEqual(count_inclusive_and_overlapping(sections), (2, 4))
+
+    def test_parse_malformed_lines(self):
+        # Lines of 3 and 5 sections are rejected although they average 4 sections
+        for content in (b"1-2,3\n4-5,6-7-8\n", b"1--2,3-4\n", b"1-2\n\n3-4,5-6\n"):
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                path = os.path.join(tmp_dir, "input")
+                with open(path, "wb") as f:
+                    f.write(content)
+                with self.subTest(content=content), self.assertRaises(ValueError):
+                    parse(path)
+
+    def test_sweep_line(self):
+        sections = parse("test_input")
+        self.assertEqual(overlapping_elves(sections).tolist(), list(range(12)))
+        self.assertEqual(max_concurrent_coverage(sections), (8, 6))
+        self.assertEqual(uncovered_sections(sections), [(1, 1)])
+        self.assertEqual(uncovered_sections(sections, 0, 12), [(0, 1), (10, 12)])
+
+    def test_sweep_line_brute_force(self):
+        rng = random.Random(1)
+        pairs = []
+        for _ in range(50):
+            starts = rng.randint(1, 90), rng.randint(1, 90)
+            pairs.append(tuple((start, start + rng.randint(0, 5)) for start in starts))
+        elves = [assignment for pair in pairs for assignment in pair]
+        sections_elves = {
+            section: sum(1 for start, end in elves if start <= section <= end)
+            for section in range(1, 100)
+        }
+        self.assertEqual(
+            overlapping_elves(pairs).tolist(),
+            [
+                idx
+                for idx, (start, end) in enumerate(elves)
+                if any(
+                    start <= other_end and other_start <= end
+                    for other_idx, (other_start, other_end) in enumerate(elves)
+                    if other_idx != idx
+                )
+            ],
+        )
+        max_count = max(sections_elves.values())
+        self.assertEqual(
+            max_concurrent_coverage(pairs),
+            (max_count, min(s for s, c in sections_elves.items() if c == max_count)),
+        )
+        uncovered = [section for section, count in sections_elves.items() if not count]
+        self.assertEqual(
+            [
+                s
+                for start, end in uncovered_sections(pairs, 1, 99)
+                for s in range(start, end + 1)
+            ],
+            uncovered,
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,19 +1,21 @@
 from __future__ import annotations
 
 import re
-import os
-import sys
-
-sys.path.append(os.path.abspath(os.path.join("..")))
 
 from utils import cat, parse_input, transpose
 
 Stack = list[str]  # first element is the bottom of the stack, last is the top
 Stacks = dict[str, Stack]
 Move = tuple[int, str, str]
+Notes = tuple[str, str]  # stacks drawing and rearrangement procedure inputs
 MOVE_PATTERN = re.compile(r"move (\d+) from (\d+) to (\d+)")
 
 
+def parse(path: str = "./input") -> Notes:
+    stacks_input, moves_input = parse_input(path, sep="\n\n")
+    return stacks_input, moves_input
+
+
 def parse_stacks(stacks_input: str) -> Stacks:
     # Stacks are represented vertically, we need a horizontal representation so
     # that each stacks is represented by a single line (not a column)
@@ -50,7 +52,8 @@ def moves_crates_all_at_once(stacks: Stacks, move: Move) -> Stacks:
     return stacks
 
 
-def solve_part_1(stacks_input: str, moves_input: str) -> str:
+def solve_part_1(notes: Notes) -> str:
+    stacks_input, moves_input = notes
     stacks = parse_stacks(stacks_input)
     moves = parse_moves(moves_input)
     for move in moves:
@@ -59,7 +62,8 @@ def solve_part_1(stacks_input: str, moves_input: str) -> str:
     return stacks_tops
 
 
-def solve_part_2(stacks_input: str, moves_input: str) -> str:
+def solve_part_2(notes: Notes) -> str:
+    stacks_input, moves_input = notes
     stacks = parse_stacks(stacks_input)
     moves = parse_moves(moves_input)
     for move in moves:
@@ -69,6 +73,6 @@ def solve_part_2(stacks_input: str, moves_input: str) -> str:
 
 
 if __name__ == "__main__":
-    stacks_input, moves_input = parse_input(sep="\n\n")
-    print("Part 1:", solve_part_1(stacks_input, moves_input))
-    print("Part 2:", solve_part_2(stacks_input, moves_input))
+    notes = parse()
+    print("Part 1:", solve_part_1(notes))
+    print("Part 2:", solve_part_2(notes))
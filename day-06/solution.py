@@ -1,39 +1,44 @@
 from __future__ import annotations
 
-import os
-import sys
-from typing import Generator, Optional
+from typing import Optional
 
-sys.path.append(os.path.abspath(os.path.join("..")))
-
-from utils import parse_input
+from utils import LETTERS_BITS, parse_input, popcount
 
 START_PACKET_LENGTH = 4
 START_MESSAGE_LENGTH = 14
 
 
-def sliding_window(input: str, size: int = 1) -> Generator[str, None, None]:
-    for i in range(0, len(input) - size):
-        yield input[i : i + size]
+def parse(path: str = "./input") -> str:
+    data_stream, *_ = parse_input(path)
+    return data_stream
 
 
-def are_chars_uniques(chars: str) -> bool:
-    return len(set(chars)) == len(chars)
+def find_marker_end(data_stream: str, marker_length: int) -> Optional[int]:
+    """
+    Each character flips its bit in the window mask when entering and when leaving
+    the window. A character appearing twice in the window cancels its own bit, so
+    the window characters are all unique only when as many bits as characters
+    are set.
+    """
+    data = data_stream.encode()
+    window_mask = 0
+    for idx, byte in enumerate(data):
+        window_mask ^= LETTERS_BITS[byte]
+        if idx >= marker_length:
+            window_mask ^= LETTERS_BITS[data[idx - marker_length]]
+        if popcount(window_mask) == marker_length:
+            return idx + 1
 
 
 def solve_part_1(data_stream: str) -> Optional[int]:
-    for i, chars in enumerate(sliding_window(data_stream, size=START_PACKET_LENGTH)):
-        if are_chars_uniques(chars):
-            return i + START_PACKET_LENGTH
+    return find_marker_end(data_stream, START_PACKET_LENGTH)
 
 
 def solve_part_2(data_stream: str) -> Optional[int]:
-    for i, chars in enumerate(sliding_window(data_stream, size=START_MESSAGE_LENGTH)):
-        if are_chars_uniques(chars):
-            return i + START_MESSAGE_LENGTH
+    return find_marker_end(data_stream, START_MESSAGE_LENGTH)
 
 
 if __name__ == "__main__":
-    data_stream, *_ = parse_input()
+    data_stream = parse()
     print("Part 1:", solve_part_1(data_stream))
     print("Part 2:", solve_part_2(data_stream))
@@ -3,12 +3,8 @@ from dataclasses import dataclass, field
 from operator import attrgetter
 
 import re
-import os
-import sys
 from typing import Union
 
-sys.path.append(os.path.abspath(os.path.join("..")))
-
 from utils import flatten, parse_input
 
 Command = tuple[str, list[str]]
@@ -25,6 +21,11 @@ def parse_terminal_command(terminal_output: str) -> Command:
     return command, output
 
 
+def parse(path: str = "./input") -> tuple[Command, ...]:
+    # Skip the first command that cd into root dir
+    return parse_input(path, sep="\n$ ", parse_fn=parse_terminal_command)[1:]
+
+
 @dataclass
 class File:
     size: int
@@ -97,7 +98,6 @@ def solve_part_2(terminal_session: tuple[Command, ...]) -> int:
 
 
 if __name__ == "__main__":
-    # Skip the first command that cd into root dir
-    terminal_session = parse_input(sep="\n$ ", parse_fn=parse_terminal_command)[1:]
+    terminal_session = parse()
     print("Part 1:", solve_part_1(terminal_session))
     print("Part 2:", solve_part_2(terminal_session))
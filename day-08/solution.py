@@ -1,41 +1,38 @@
 from __future__ import annotations
 from functools import partial
-from itertools import chain
 
-import os
-import sys
 from typing import Sequence, TypeVar
 
-sys.path.append(os.path.abspath(os.path.join("..")))
+import numpy as np
 
-from utils import count_if, overlay, parse_input, reverse, transpose
+from utils import Grid, parse_input
 
 T = TypeVar("T")
 Line = Sequence[T]
-Grid = Sequence[Sequence[T]]
 
 
 def parse_line(line: str) -> Line[int]:
     return tuple(int(char) for char in line)
 
 
-def compute_line_visibility(trees_line: Line[int]) -> Line[bool]:
+def parse(path: str = "./input") -> Grid:
+    return Grid(Grid.from_lines(parse_input(path)).array - ord("0"))
+
+
+def compute_lines_visibility(trees_grid: Grid) -> Grid:
     """
-    Transforms a trees line into the visibility (True/False) of each tree, looking
-    from the start of the line to the end of the line.
+    Transforms each trees line into the visibility (True/False) of each tree,
+    looking from the start of the line to the end of the line: a tree is visible
+    if it's taller than all the trees before it.
     """
-    tallest = -1
-    visibilities = []
-    for tree in trees_line:
-        if tree > tallest:
-            visibilities.append(True)
-            tallest = tree
-        else:
-            visibilities.append(False)
-    return visibilities
-
-
-def compute_grid_visibility(trees_grid: Grid[int]) -> Grid[bool]:
+    heights = trees_grid.array
+    tallest_before = np.maximum.accumulate(heights, axis=1)
+    visibilities = np.ones(heights.shape, dtype=bool)
+    visibilities[:, 1:] = heights[:, 1:] > tallest_before[:, :-1]
+    return Grid(visibilities)
+
+
+def compute_grid_visibility(trees_grid: Grid) -> Grid:
     """
     A tree is visible if it can be seen looking from the left, right, top or
     bottom of the grid.
@@ -45,58 +42,41 @@ def compute_grid_visibility(trees_grid: Grid[int]) -> Grid[bool]:
     All the visibilities are then combined (a tree is globally visible if it can
     be seen from any direction) to determine its global visibility.
     """
-    visible_from_left = tuple(compute_line_visibility(line) for line in trees_grid)
-    visible_from_right = reverse(
-        tuple(compute_line_visibility(line) for line in reverse(trees_grid))
-    )
-    visible_from_top = transpose(
-        tuple(compute_line_visibility(line) for line in transpose(trees_grid))
-    )
-    visible_from_bottom = transpose(
-        reverse(
-            tuple(
-                compute_line_visibility(line) for line in reverse(transpose(trees_grid))
-            )
-        )
-    )
-    visible_from_anywhere = overlay(
+    columns = trees_grid.transpose()
+    visible_from_left = compute_lines_visibility(trees_grid)
+    visible_from_right = compute_lines_visibility(trees_grid.flip()).flip()
+    visible_from_top = compute_lines_visibility(columns).transpose()
+    visible_from_bottom = compute_lines_visibility(columns.flip()).flip().transpose()
+    visible_from_anywhere = Grid.overlay(
         visible_from_left,
         visible_from_right,
         visible_from_top,
         visible_from_bottom,
-        reducer=any,
+        reducer=np.logical_or,
     )
     return visible_from_anywhere
 
 
-def solve_part_1(trees_grid: Grid[int]) -> int:
-    visible_trees = compute_grid_visibility(trees_grid)
-    visible_count = count_if(chain(*visible_trees))
-    return visible_count
+def solve_part_1(trees_grid: Grid | Sequence[Line[int]]) -> int:
+    visible_trees = compute_grid_visibility(Grid(trees_grid))
+    return int(visible_trees.array.sum())
 
 
-def visibility_count(trees_line: Line[int]) -> int:
+def visibility_count(trees_line: np.ndarray) -> int:
     """
     Number of trees in the line having an height less than the first tree (the
     count includes the first tree).
     """
-    starting_height, *heights = trees_line
-    return next(
-        (idx + 1 for idx, height in enumerate(heights) if height >= starting_height),
-        len(heights),
-    )
-
-
-def column_from_grid(grid: Grid, col_idx: int) -> Line:
-    return tuple(line[col_idx] for line in grid)
+    blocking_trees = np.flatnonzero(trees_line[1:] >= trees_line[0])
+    return blocking_trees[0] + 1 if blocking_trees.size else len(trees_line) - 1
 
 
-def compute_scenic_score(trees_grid: Grid[int], tree_x: int, tree_y: int) -> int:
-    trees_to_the_right = trees_grid[tree_x][tree_y:]
-    trees_to_the_left = trees_grid[tree_x][: tree_y + 1][::-1]
-    trees_to_the_bottom = column_from_grid(trees_grid, tree_y)[tree_x:]
-    trees_to_the_top = column_from_grid(trees_grid, tree_y)[: tree_x + 1][::-1]
-    return (
+def compute_scenic_score(trees_grid: Grid, tree_x: int, tree_y: int) -> int:
+    trees_to_the_right = trees_grid[tree_x, tree_y:]
+    trees_to_the_left = trees_grid[tree_x, : tree_y + 1][::-1]
+    trees_to_the_bottom = trees_grid[tree_x:, tree_y]
+    trees_to_the_top = trees_grid[: tree_x + 1, tree_y][::-1]
+    return int(
         visibility_count(trees_to_the_right)
         * visibility_count(trees_to_the_left)
         * visibility_count(trees_to_the_bottom)
@@ -104,7 +84,8 @@ def compute_scenic_score(trees_grid: Grid[int], tree_x: int, tree_y: int) -> int
     )
 
 
-def solve_part_2(trees_grid: Grid[int]) -> int:
+def solve_part_2(trees_grid: Grid | Sequence[Line[int]]) -> int:
+    trees_grid = Grid(trees_grid)
     grid_side = len(trees_grid)
     visible_trees = compute_grid_visibility(trees_grid)
     get_scenic_score = partial(compute_scenic_score, trees_grid)
@@ -118,11 +99,11 @@ def solve_part_2(trees_grid: Grid[int]) -> int:
         get_scenic_score(x, y)
         for x in range(1, grid_side)
         for y in range(1, grid_side)
-        if visible_trees[x][y] is True
+        if visible_trees[x, y]
     )
 
 
 if __name__ == "__main__":
-    trees_grid = parse_input(parse_fn=parse_line)
+    trees_grid = parse()
     print("Part 1:", solve_part_1(trees_grid))
     print("Part 2:", solve_part_2(trees_grid))
@@ -1,44 +1,10 @@
 from __future__ import annotations
-from dataclasses import dataclass
 
-import os
-import sys
 from typing import Iterable
 
-sys.path.append(os.path.abspath(os.path.join("..")))
+from utils import assert_never, pack, parse_input, flatten, sliding_window
 
-from utils import assert_never, parse_input, flatten, sliding_window
-
-
-@dataclass(frozen=True)
-class Point:
-    x: int
-    y: int
-
-    def move(self, vector: Vector) -> Point:
-        return type(self)(self.x + vector.x, self.y + vector.y)
-
-
-@dataclass(frozen=True)
-class Vector:
-    x: int  # horizontal dimension
-    y: int  # vertical dimension
-
-    @classmethod
-    def from_points(cls, start: Point, end: Point) -> Vector:
-        return cls(end.x - start.x, end.y - start.y)
-
-    def as_tuple(self) -> tuple[int, int]:
-        return self.x, self.y
-
-    def as_tail_move(self) -> Vector:
-        """
-        Returns a vector whose absolute value in any dimension is less or equal to 1
-        """
-        return type(self)(normalize_dim(self.x), normalize_dim(self.y))
-
-
-ORIGIN = Point(0, 0)
+Vector = tuple[int, int]  # horizontal and vertical dimensions
 
 
 def normalize_dim(dim: int) -> int:
@@ -52,60 +18,58 @@ def motions_vectors_from_line(line: str) -> tuple[Vector]:
     count = int(count)
     match move:
         case "R":
-            vector = Vector(1, 0)
+            vector = (1, 0)
         case "L":
-            vector = Vector(-1, 0)
+            vector = (-1, 0)
         case "U":
-            vector = Vector(0, 1)
+            vector = (0, 1)
         case "D":
-            vector = Vector(0, -1)
+            vector = (0, -1)
         case _:
             assert_never(move)
     return tuple(vector for _ in range(count))
 
 
-def next_tail_position(*, head_pos: Point, tail_pos: Point) -> Point:
-    """Next position of the tail given the current head and tail positions"""
-    vector = Vector.from_points(tail_pos, head_pos)
-    # Head is over or moving around the tail, no need to move the tail
-    if sorted(abs(dim) for dim in vector.as_tuple()) in ([0, 0], [0, 1], [1, 1]):
-        return tail_pos
-    return tail_pos.move(vector.as_tail_move())
+def parse(path: str = "./input") -> tuple[Vector, ...]:
+    return tuple(flatten(parse_input(path, parse_fn=motions_vectors_from_line)))
 
 
-def solve_part_1(head_moves: Iterable[Vector]) -> int:
-    tail_pos = ORIGIN
-    tail_pos_history = {tail_pos}
-    # Initially the head covers the tail, let's move it away from the tail.
-    head_moves = iter(head_moves)
-    head_pos = ORIGIN.move(next(head_moves))
-    for vector in head_moves:
-        head_pos = head_pos.move(vector)
-        tail_pos = next_tail_position(head_pos=head_pos, tail_pos=tail_pos)
-        tail_pos_history.add(tail_pos)
+def count_tail_positions(head_moves: Iterable[Vector], knots_count: int) -> int:
+    """
+    Moves the rope head and returns the number of distinct positions visited by
+    the tail. Knots coordinates are kept as plain ints and tail positions are
+    stored packed, so that no point object is allocated along the way.
+    """
+    knots_x, knots_y = [0] * knots_count, [0] * knots_count
+    knots_pairs = tuple(sliding_window(range(knots_count), size=2))
+    tail_pos_history = {pack(0, 0)}
+    for dx, dy in head_moves:
+        knots_x[0] += dx
+        knots_y[0] += dy
+        # We can move all the other knots by taking them two-by-two and considering
+        # the first one as the head and the second one as the tail.
+        for idx, next_idx in knots_pairs:
+            dx = knots_x[idx] - knots_x[next_idx]
+            dy = knots_y[idx] - knots_y[next_idx]
+            # Head is over or moving around the tail, no need to move the tail
+            # (nor the following knots).
+            if abs(dx) <= 1 and abs(dy) <= 1:
+                break
+            knots_x[next_idx] += normalize_dim(dx)
+            knots_y[next_idx] += normalize_dim(dy)
+        tail_pos_history.add(pack(knots_x[-1], knots_y[-1]))
     return len(tail_pos_history)
 
 
+def solve_part_1(head_moves: Iterable[Vector]) -> int:
+    return count_tail_positions(head_moves, knots_count=2)
+
+
 def solve_part_2(head_moves: Iterable[Vector]) -> int:
-    knots_pos = [ORIGIN for _ in range(10)]
-    tail_pos_history = {knots_pos[-1]}
-    head_moves = iter(head_moves)
-    # Initially the head covers all the over knots, let's move it away
-    knots_pos[0] = knots_pos[0].move(next(head_moves))
-    for vector in head_moves:
-        knots_pos[0] = knots_pos[0].move(vector)
-        # We can move all the other knots by taking them two-by-two and considering
-        # the first one as the head and the second one as the tail of the first
-        # part.
-        for idx, next_idx in sliding_window(range(len(knots_pos)), size=2):
-            knots_pos[next_idx] = next_tail_position(
-                head_pos=knots_pos[idx], tail_pos=knots_pos[next_idx]
-            )
-        tail_pos_history.add(knots_pos[-1])
-    return len(tail_pos_history)
+    return count_tail_positions(head_moves, knots_count=10)
 
 
 if __name__ == "__main__":
-    head_moves = tuple(flatten(parse_input(parse_fn=motions_vectors_from_line)))
+    head_moves = parse()
     print("Part 1:", solve_part_1(head_moves))
     print("Part 2:", solve_part_2(head_moves))
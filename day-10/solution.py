@@ -1,15 +1,10 @@
 from __future__ import annotations
 from functools import partial
 
-import os
-import sys
 from operator import add
-from rich import print
 from typing import Callable
 
-sys.path.append(os.path.abspath(os.path.join("..")))
-
-from utils import assert_never, flatten, parse_input
+from utils import assert_never, flatten, parse_input, pretty_print
 
 RegisterUpdater = Callable[[int], int]
 identity = lambda x: x
@@ -34,6 +29,10 @@ def parse_instruction(line: str) -> tuple[RegisterUpdater, ...]:
         assert_never(line)
 
 
+def parse(path: str = "./input") -> tuple[RegisterUpdater, ...]:
+    return tuple(flatten(parse_input(path, parse_fn=parse_instruction)))
+
+
 def solve_part_1(instructions: tuple[RegisterUpdater, ...]) -> int:
     register = 1
     compute_signal_strength = lambda cycle, register: cycle * register
@@ -65,6 +64,6 @@ def solve_part_2(instructions) -> list[str]:
 
 
 if __name__ == "__main__":
-    instructions = tuple(flatten(parse_input(parse_fn=parse_instruction)))
-    print("Part 1:", solve_part_1(instructions))
-    print("Part 2:", solve_part_2(instructions))
+    instructions = parse()
+    pretty_print("Part 1:", solve_part_1(instructions))
+    pretty_print("Part 2:", solve_part_2(instructions))
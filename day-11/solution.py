@@ -3,16 +3,11 @@ from collections import defaultdict
 from dataclasses import dataclass
 from functools import reduce
 
-import os
 import re
-import sys
 from operator import add, mul
-from rich import print
 from typing import Callable
 
-sys.path.append(os.path.abspath(os.path.join("..")))
-
-from utils import assert_never, parse_input
+from utils import assert_never, parse_input, pretty_print
 
 
 Item = int
@@ -73,6 +68,10 @@ def parse_monkey(text_desc: str) -> Monkey:
     )
 
 
+def parse(path: str = "./input") -> tuple[Monkey, ...]:
+    return parse_input(path, sep="\n\n", parse_fn=parse_monkey)
+
+
 def solve_part_1(monkeys: tuple[Monkey, ...]) -> int:
     seen_items_counts = defaultdict(lambda: 0)
     for _ in range(20):
@@ -108,8 +107,8 @@ def solve_part_2(monkeys: tuple[Monkey, ...]) -> int:
 
 
 if __name__ == "__main__":
-    monkeys = parse_input(sep="\n\n", parse_fn=parse_monkey)
-    print("Part 1:", solve_part_1(monkeys))
+    monkeys = parse()
+    pretty_print("Part 1:", solve_part_1(monkeys))
     # Monkeys items lists were mutated in part 1, re-initialize them
-    monkeys = parse_input(sep="\n\n", parse_fn=parse_monkey)
-    print("Part 2:", solve_part_2(monkeys))
+    monkeys = parse()
+    pretty_print("Part 2:", solve_part_2(monkeys))
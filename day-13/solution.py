@@ -1,22 +1,20 @@
 from __future__ import annotations
 from functools import cmp_to_key, reduce
 from operator import mul
+import json
 
-import os
-import sys
-from rich import print
-
-sys.path.append(os.path.abspath(os.path.join("..")))
-
-from utils import parse_input, flatten
+from utils import parse_input, flatten, pretty_print
 
 DIVIDER_PACKETS = ([[2]], [[6]])
 
 
 def parse_packets_pair(two_lines: str) -> tuple[list, list]:
     first_line, second_line = two_lines.split("\n")
-    # eval should not be used against arbitrary input but it's safe here
-    return eval(first_line), eval(second_line)
+    return json.loads(first_line), json.loads(second_line)
+
+
+def parse(path: str = "./input") -> tuple[tuple[list, list], ...]:
+    return parse_input(path, sep="\n\n", parse_fn=parse_packets_pair)
 
 
 def are_packets_in_order(left_packet: list, right_packet: list) -> bool | None:
@@ -78,6 +76,6 @@ def solve_part_2(packets_pairs: tuple[tuple[list, list]]) -> int:
 
 
 if __name__ == "__main__":
-    packets_pairs = parse_input(sep="\n\n", parse_fn=parse_packets_pair)
-    print("Part 1:", solve_part_1(packets_pairs))
-    print("Part 2:", solve_part_2(packets_pairs))
+    packets_pairs = parse()
+    pretty_print("Part 1:", solve_part_1(packets_pairs))
+    pretty_print("Part 2:", solve_part_2(packets_pairs))
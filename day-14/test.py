@@ -4,7 +4,12 @@ import sys
 
 sys.path.append(os.path.abspath(os.path.join("..")))
 
-from solution import parse_line, solve_part_1, solve_part_2  # noqa: E402
+from solution import (  # noqa: E402
+    parse,
+    parse_line,
+    solve_part_1,
+    solve_part_2,
+)
 from utils import parse_input  # noqa: E402
 
 
@@ -17,6 +22,12 @@ class TestDay1(unittest.TestCase):
         paths_list = parse_input("test_input", parse_fn=parse_line)
         self.assertEqual(solve_part_2(paths_list), 93)
 
+    def test_parse(self):
+        self.assertEqual(
+            parse("test_input"),
+            parse_input("test_input", parse_fn=parse_line),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,26 +1,33 @@
 from __future__ import annotations
-from itertools import chain
 
-import os
-import sys
-from typing import Generator
-from rich import print
+from typing import Iterable
 
-sys.path.append(os.path.abspath(os.path.join("..")))
-
-from utils import (  # noqa: E402
+from metrics import enable_metrics_from_env, gauge, progress, timed_phase
+from utils import (
     batchify,
     flatten,
-    parse_input,
+    IntervalSet,
+    load_ints,
     parse_ints,
     Point,
+    pretty_print,
+    reshape,
     X,
     Y,
 )
 
 
 def parse_line(line: str) -> tuple[Point, Point]:
-    return tuple(tuple(el) for el in batchify(parse_ints(line), batch_size=2))
+    return tuple(batchify(parse_ints(line), batch_size=2))
+
+
+def parse(path: str = "./input") -> tuple[tuple[Point, Point]]:
+    """Same as parsing each line with parse_line but for the whole file at once."""
+    values, _ = load_ints(path)
+    return tuple(
+        ((s_x, s_y), (b_x, b_y))
+        for s_x, s_y, b_x, b_y in reshape(values, width=4).tolist()
+    )
 
 
 def manhattan_distance(point: Point, other_point: Point) -> int:
@@ -31,80 +38,87 @@ def sensor_range(sensor: Point, closest_beacon: Point) -> int:
     return manhattan_distance(sensor, closest_beacon)
 
 
-def is_in_range(loc: Point, sensor_loc: Point, sensor_range: int) -> int:
-    return manhattan_distance(loc, sensor_loc) <= sensor_range
-
-
-def sensor_border(sensor: Point, s_range: int) -> Generator[Point, None, None]:
-    x_range = range(-s_range, s_range + 1)
-    y_range = chain(range(0, s_range), range(s_range, -1, -1))
-    for x, y in zip(x_range, y_range):
-        yield (X(sensor) + x, Y(sensor) + y)
-        if abs(Y(sensor)) != (abs(y)):
-            yield (X(sensor) + x, Y(sensor) - y)
+def row_coverage(
+    sensors_and_ranges: Iterable[tuple[Point, int]], row_idx: int
+) -> IntervalSet:
+    """Locations along the row that can be reached by any of the sensors."""
+    coverage = IntervalSet()
+    for s_loc, s_range in sensors_and_ranges:
+        # The further the sensor is from the row, the narrower its coverage
+        half_width = s_range - abs(Y(s_loc) - row_idx)
+        coverage.add(X(s_loc) - half_width, X(s_loc) + half_width)
+    return coverage
 
 
-def solve_part_1(sensors_and_beacons: tuple[tuple[Point, Point]], row_idx: int) -> int:
+def solve_part_1(
+    sensors_and_beacons: tuple[tuple[Point, Point]], row_idx: int = 2_000_000
+) -> int:
     # Locations where sensors or beacons are already present must not be considered
     ignored_locations = set(
-        loc for loc in flatten(sensors_and_beacons) if Y(loc) == row_idx
+        X(loc) for loc in flatten(sensors_and_beacons) if Y(loc) == row_idx
     )
-    # Discard sensors that are vertically too far away (i.e. their range don't allow
-    # them to reach the row we're searching).
-    candidate_sensors = tuple(
-        (sensor, sensor_range(sensor, beacon))
-        for sensor, beacon in sensors_and_beacons
-        if abs(Y(sensor) - row_idx) <= sensor_range(sensor, beacon)
+    sensors_and_ranges = tuple(
+        (sensor, sensor_range(sensor, beacon)) for sensor, beacon in sensors_and_beacons
     )
-    # Determine the locations along the row we are searching that can be reached by
-    # any candidate sensor. Since we need to keep track of the locations (a single
-    # location could be reached by multiple sensors) it's less memory efficient than
-    # iterating over all the locations in the row but a bit faster.
-    excluded_locations = set()
-    for s_loc, s_range in candidate_sensors:
-        excluded_locations.update(
-            (x, row_idx)
-            for x in range(
-                X(s_loc) - (s_range - abs(Y(s_loc) - row_idx)),
-                X(s_loc) + (s_range - abs(Y(s_loc) - row_idx)) + 1,
-            )
-            if (x, row_idx) not in ignored_locations
-        )
-    return len(excluded_locations)
+    # Sensors that are vertically too far away (i.e. their range don't allow them to
+    # reach the row we're searching) have empty coverages and are simply ignored.
+    coverage = row_coverage(sensors_and_ranges, row_idx)
+    return coverage.covered_length - sum(1 for x in ignored_locations if x in coverage)
+
+
+def border_lines(
+    sensors_and_ranges: Iterable[tuple[Point, int]]
+) -> tuple[set[int], set[int]]:
+    """
+    Lines just outside the sensors borders, as the y - x values of their rising
+    lines and the y + x values of their falling lines.
+    """
+    rising_lines, falling_lines = set(), set()
+    for s_loc, s_range in sensors_and_ranges:
+        for offset in (-s_range - 1, s_range + 1):
+            rising_lines.add(Y(s_loc) - X(s_loc) + offset)
+            falling_lines.add(Y(s_loc) + X(s_loc) + offset)
+    return rising_lines, falling_lines
 
 
 def solve_part_2(
-    sensors_and_beacons: tuple[tuple[Point, Point]], search_range: int
+    sensors_and_beacons: tuple[tuple[Point, Point]], search_range: int = 4_000_000
 ) -> int | None:
-    excluded_locations = set(
-        loc
-        for loc in flatten(sensors_and_beacons)
-        if 0 <= X(loc) <= search_range and 0 <= Y(loc) <= search_range
+    sensors_and_ranges = tuple(
+        (sensor, sensor_range(sensor, beacon)) for sensor, beacon in sensors_and_beacons
     )
     # Since the location we're looking for is the only one not in range of any sensor
-    # it can only be next to a sensor's border (otherwise there would be several
-    # locations not in range).
-    for idx, (s_loc, b_loc) in enumerate(sensors_and_beacons, start=1):
-        print(f"Processing sensor {idx}/{len(sensors_and_beacons)}")
-        distress_beacon_location = next(
-            (
-                loc
-                for loc in sensor_border(s_loc, sensor_range(s_loc, b_loc) + 1)
-                if loc not in excluded_locations
-                and 0 <= X(loc) <= search_range
-                and 0 <= Y(loc) <= search_range
-                and not any(
-                    is_in_range(loc, s_loc, sensor_range(s_loc, b_loc))
-                    for s_loc, b_loc in sensors_and_beacons
-                )
-            ),
-            None,
-        )
-        if distress_beacon_location is not None:
-            return X(distress_beacon_location) * 4_000_000 + Y(distress_beacon_location)
+    # it's surrounded by sensors borders, i.e. it's where a rising and a falling
+    # line just outside of the borders cross, unless it's at the edge of the search
+    # area. Only the rows of these locations are searched for a gap in coverage.
+    rising_lines, falling_lines = border_lines(sensors_and_ranges)
+    candidate_rows = {
+        (rising + falling) // 2
+        for rising in rising_lines
+        for falling in falling_lines
+        if (rising + falling) % 2 == 0
+    }
+    for line in rising_lines:
+        candidate_rows.update((line, line + search_range))
+    for line in falling_lines:
+        candidate_rows.update((line, line - search_range))
+    candidate_rows.update((0, search_range))
+    searched_rows = sorted(row for row in candidate_rows if 0 <= row <= search_range)
+    gauge("day 15 candidate rows", len(searched_rows))
+    for idx, row_idx in enumerate(searched_rows, start=1):
+        progress("day 15 rows", idx, len(searched_rows))
+        coverage = row_coverage(sensors_and_ranges, row_idx)
+        gap = next(coverage.gaps(0, search_range), None)
+        if gap is not None:
+            return gap[0] * 4_000_000 + row_idx
 
 
 if __name__ == "__main__":
-    sensors_and_beacons = parse_input(parse_fn=parse_line)
-    print("Part 1:", solve_part_1(sensors_and_beacons, row_idx=2_000_000))
-    print("Part 2:", solve_part_2(sensors_and_beacons, search_range=4_000_000))
+    enable_metrics_from_env()
+    sensors_and_beacons = parse()
+    with timed_phase("day 15 part 1"):
+        answer = solve_part_1(sensors_and_beacons)
+    pretty_print("Part 1:", answer)
+    with timed_phase("day 15 part 2"):
+        answer = solve_part_2(sensors_and_beacons)
+    pretty_print("Part 2:", answer)
@@ -1,31 +1,25 @@
 from __future__ import annotations
-import copy
-from functools import partial, reduce
-from itertools import permutations
-from operator import itemgetter
 
 import re
-import os
-import sys
 from typing import NamedTuple
-from rich import print
 
-sys.path.append(os.path.abspath(os.path.join("..")))
-
-from utils import (  # noqa: E402
+from metrics import enable_metrics_from_env, gauge, timed_phase
+from utils import (
+    all_pairs_distances,
     assert_never,
-    bfs_shortest_path,
-    first,
+    iter_bits,
     parse_input,
-    sliding_window,
+    pretty_print,
 )
 
 Valve = NamedTuple("Valve", [("flow", int), ("neighbors", set[str])])
 ValvesGraph = dict[str, Valve]
+ValvesMask = int  # bit i is set when the i-th valve with a flow > 0 is opened
 
 LINE_PATTERN = re.compile(
     r"""Valve ([A-Z]{2}) has flow rate=(\d+); tunnels* leads* to valves* (.+)"""
 )
+START_VALVE = "AA"
 
 
 def parse_line(line: str) -> tuple[str, Valve]:
@@ -35,89 +29,81 @@ def parse_line(line: str) -> tuple[str, Valve]:
     assert_never(line)
 
 
-def compute_total_pressure_released(
-    graph: ValvesGraph, paths: dict[tuple[str, str], int], steps: list[str]
-) -> int:
-    openings = []
-    remaining_time = 30
-    for v_from, v_to in sliding_window(steps, size=2):
-        remaining_time -= paths[(v_from, v_to)]
-        openings.append((remaining_time, graph[v_to].flow))
-    return sum(time * flow for time, flow in openings if time > 0)
-
-
-def solve_part_1(valves_graph: ValvesGraph) -> int:
-    shortest_path = partial(bfs_shortest_path, valves_graph)
-
-    valves_of_interest = tuple(
-        key for key, value in valves_graph.items() if value.flow != 0
-    )
-    print("Valves with flow > 0:", len(valves_of_interest))
-    paths_of_interest: dict[tuple[str, str], int] = {}
-    for start, end in permutations(("AA",) + valves_of_interest, r=2):
-        distance = len(shortest_path(start, end))
-        paths_of_interest |= {(start, end): distance, (end, start): distance}
-    print(
-        sorted(
-            (start, end, dist, valves_graph[end].flow)
-            for (start, end), dist in paths_of_interest.items()
-        )
-    )
-
-    total_pressure_released = partial(
-        compute_total_pressure_released, valves_graph, paths_of_interest
-    )
-    steps = ["AA"]
-    for _ in range(len(valves_of_interest)):
-        curr_valve = steps[-1]
-        next_valve = first(
-            sorted(
+def parse(path: str = "./input") -> ValvesGraph:
+    return dict(parse_input(path, parse_fn=parse_line))
+
+
+def max_pressure_by_opened_valves(
+    valves_graph: ValvesGraph, time_limit: int
+) -> dict[ValvesMask, int]:
+    """
+    Explores every order in which valves with a flow can be opened within the time
+    limit, and returns the maximum pressure released for each set of opened valves.
+    Only valves with a flow are worth moving to, the time needed to go from a
+    valve to another one is given by the distances between all valves.
+    """
+    distances, index = all_pairs_distances(valves_graph)
+    valves = tuple(index[key] for key, valve in valves_graph.items() if valve.flow)
+    flows = tuple(valve.flow for valve in valves_graph.values() if valve.flow)
+    max_pressures: dict[ValvesMask, int] = {}
+    # Position, remaining time, opened valves and released pressure of each state
+    states = [(index[START_VALVE], time_limit, 0, 0)]
+    while states:
+        position, remaining_time, opened, pressure = states.pop()
+        if pressure > max_pressures.get(opened, -1):
+            max_pressures[opened] = pressure
+        for bit, (valve, flow) in enumerate(zip(valves, flows)):
+            if opened & (1 << bit):
+                continue
+            # Travel time plus the minute spent opening the valve
+            time_after_opening = remaining_time - distances[position][valve] - 1
+            if time_after_opening <= 0:
+                continue
+            states.append(
                 (
-                    end
-                    for (start, end), distance in paths_of_interest.items()
-                    if start == curr_valve and end not in steps
-                ),
-                key=lambda v: paths_of_interest[(curr_valve, v)],
-            ),
-        )
-        steps.append(next_valve)
-    print(steps)
-    released_pressure = total_pressure_released(steps)
-
-    for idx, _ in enumerate(steps[1:]):
-        for next_idx, _ in enumerate(steps[idx:]):
-            alternate_steps = copy.copy(steps)
-            alternate_steps[idx], alternate_steps[next_idx] = (
-                alternate_steps[next_idx],
-                alternate_steps[idx],
+                    valve,
+                    time_after_opening,
+                    opened | (1 << bit),
+                    pressure + time_after_opening * flow,
+                )
             )
-            if total_pressure_released(alternate_steps) > released_pressure:
-                steps = alternate_steps
-                released_pressure = alternate_steps
-                break
-
-    print(steps)
-    return released_pressure
-
-    # distances = sorted(paths_of_interest.values())[::2]
-    # max_steps = next(i - 1 for i in range(1, len(distances)) if sum(distances[:i]) > 30)
-    # print("Max steps:", max_steps)
-
-    # possible_steps = (
-    #     ("AA",) + faster_steps
-    #     for faster_steps in permutations(
-    #         valves_of_interest, r=min(len(valves_of_interest), max_steps)
-    #     )
-    # )
-    # return max(total_pressure_released(faster_steps) for faster_steps in possible_steps)
-    # A > D > B > J > H > E > C
+    gauge("day 16 opened valves sets", len(max_pressures))
+    return max_pressures
 
 
-def solve_part_2():
-    pass
+def solve_part_1(valves_graph: ValvesGraph) -> int:
+    return max(max_pressure_by_opened_valves(valves_graph, time_limit=30).values())
+
+
+def solve_part_2(valves_graph: ValvesGraph) -> int:
+    with timed_phase("day 16 exploration"):
+        max_pressures = max_pressure_by_opened_valves(valves_graph, time_limit=26)
+    valves_count = sum(1 for valve in valves_graph.values() if valve.flow)
+    all_valves = (1 << valves_count) - 1
+    # Best pressure when opening any subset of each set of valves, computed from
+    # the smallest sets to the largest ones.
+    max_subset_pressures = [0] * (all_valves + 1)
+    with timed_phase("day 16 subsets"):
+        for opened in range(all_valves + 1):
+            subsets_pressures = (
+                max_subset_pressures[opened ^ (1 << bit)] for bit in iter_bits(opened)
+            )
+            max_subset_pressures[opened] = max(
+                max_pressures.get(opened, 0), max(subsets_pressures, default=0)
+            )
+    # The elephant opens valves among the ones we didn't open
+    return max(
+        pressure + max_subset_pressures[all_valves ^ opened]
+        for opened, pressure in max_pressures.items()
+    )
 
 
 if __name__ == "__main__":
-    valves_graph = dict(parse_input(parse_fn=parse_line))
-    print("Part 1:", solve_part_1(valves_graph))
-    # print("Part 2:", solve_part_2(sensors_and_beacons, search_range=4_000_000))
+    enable_metrics_from_env()
+    valves_graph = parse()
+    with timed_phase("day 16 part 1"):
+        answer = solve_part_1(valves_graph)
+    pretty_print("Part 1:", answer)
+    with timed_phase("day 16 part 2"):
+        answer = solve_part_2(valves_graph)
+    pretty_print("Part 2:", answer)
@@ -14,7 +14,8 @@ class TestDay1(unittest.TestCase):
         self.assertEqual(solve_part_1(valves_graph), 1651)
 
     def test_part_2(self):
-        pass
+        valves_graph = dict(parse_input("test_input", parse_fn=parse_line))
+        self.assertEqual(solve_part_2(valves_graph), 1707)
 
 
 if __name__ == "__main__":
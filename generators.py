@@ -0,0 +1,448 @@
+"""
+Generates puzzle inputs of arbitrary sizes in the format of each day, e.g.:
+    python generators.py 1 10000000 -o calories.txt     # 10^7 calorie lines
+    python generators.py 12 5000 --seed 42 -o heights   # 5000x5000 heightmap
+    python generators.py 13 1000 --param max_depth=50   # deeply nested packets
+
+Inputs are valid for the solutions (e.g. a path always exists in the heightmap,
+moves never take a crate from an empty stack) and the same seed always generates
+the same input. The meaning of the size depends on the day, see the docstrings
+of the generators.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import string
+import sys
+from typing import Callable, Generator
+
+from utils import batchify
+
+Lines = Generator[str, None, None]
+InputGenerator = Callable[..., Lines]
+
+# Packets are generated and compared recursively (json.loads parses deeper ones),
+# so their depth stays below Python's default recursion limit of 1000 frames,
+# leaving room for the frames of the callers
+MAX_PACKET_DEPTH = 900
+VALVE_NAMES = tuple(
+    a + b for a in string.ascii_uppercase for b in string.ascii_uppercase
+)
+
+
+def numpy_rng(rng: random.Random):
+    """A NumPy generator seeded from rng, for days generating whole arrays."""
+    import numpy as np
+
+    return np.random.default_rng(rng.getrandbits(64))
+
+
+def generate_calories(size: int, rng: random.Random) -> Lines:
+    """size calorie lines, grouped by elf."""
+    lines_count = 0
+    while lines_count < size:
+        if lines_count:
+            yield ""
+        for _ in range(min(rng.randint(1, 15), size - lines_count)):
+            yield str(rng.randint(1000, 60_000))
+            lines_count += 1
+
+
+def generate_strategy_guide(size: int, rng: random.Random) -> Lines:
+    """size rounds."""
+    for _ in range(size):
+        yield f"{rng.choice('ABC')} {rng.choice('XYZ')}"
+
+
+def generate_rucksacks(size: int, rng: random.Random) -> Lines:
+    """size rucksacks, rounded up to a multiple of 3 (the groups size)."""
+    for _ in range(-(-size // 3)):
+        badge, *letters = rng.sample(string.ascii_letters, k=52)
+        # Each elf of the group gets its own items so that only the badge is
+        # common to the three rucksacks
+        for pool in batchify(letters, batch_size=17):
+            shared, *pool = pool
+            left_only, right_only = pool[:8], pool[8:]
+            width = rng.randint(4, 16)
+            left = [shared, badge] + rng.choices(left_only, k=width - 2)
+            right = [shared] + rng.choices(right_only, k=width - 1)
+            rng.shuffle(left)
+            rng.shuffle(right)
+            yield "".join(left + right)
+
+
+def generate_assignments(size: int, rng: random.Random) -> Lines:
+    """size pairs of assignments."""
+    for _ in range(size):
+        first_start, first_end = sorted(rng.choices(range(1, 100), k=2))
+        second_start, second_end = sorted(rng.choices(range(1, 100), k=2))
+        yield f"{first_start}-{first_end},{second_start}-{second_end}"
+
+
+def generate_crates(size: int, rng: random.Random, stacks_count: int = 9) -> Lines:
+    """size rearrangement moves (stacks are numbered with a single digit)."""
+    if not 1 < stacks_count < 10:
+        raise ValueError("Stacks count must be between 2 and 9")
+    stacks = [
+        rng.choices(string.ascii_uppercase, k=rng.randint(1, 8))
+        for _ in range(stacks_count)
+    ]
+    # With more crates than stacks, there's always a stack to move crates from
+    if sum(map(len, stacks)) == stacks_count:
+        stacks[0].append(rng.choice(string.ascii_uppercase))
+    for level in range(max(map(len, stacks)) - 1, -1, -1):
+        yield " ".join(
+            f"[{stack[level]}]" if level < len(stack) else "   " for stack in stacks
+        )
+    yield " ".join(f" {number} " for number in range(1, stacks_count + 1))
+    yield ""
+    heights = [len(stack) for stack in stacks]
+    for _ in range(size):
+        # Every stack keeps at least a crate so that all of them have a top crate
+        source = rng.choice([idx for idx, height in enumerate(heights) if height > 1])
+        destination = rng.choice([idx for idx in range(stacks_count) if idx != source])
+        count = rng.randint(1, heights[source] - 1)
+        heights[source] -= count
+        heights[destination] += count
+        yield f"move {count} from {source + 1} to {destination + 1}"
+
+
+def generate_datastream(size: int, rng: random.Random) -> Lines:
+    """
+    size characters (at least 14), the start-of-message marker being the last 14
+    characters and the start-of-packet marker the first 4 of them.
+    """
+    # Less than 4 distinct characters in the stream until the final marker, which
+    # starts with the last character before it so that no earlier window is one.
+    first = rng.choice("abc")
+    marker = first + "".join(rng.sample(string.ascii_lowercase.replace(first, ""), 13))
+    yield "".join(rng.choices("abc", k=max(size - 15, 0))) + first[: size - 14] + marker
+
+
+def random_name(rng: random.Random) -> str:
+    return "".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 8)))
+
+
+def generate_terminal_session(size: int, rng: random.Random) -> Lines:
+    """size directories (besides the root one), walked in depth-first order."""
+    children: list[list[int]] = [[] for _ in range(size + 1)]
+    for directory in range(1, size + 1):
+        children[rng.randrange(directory)].append(directory)
+    names = ["/"] + [
+        random_name(rng) + str(directory) for directory in range(1, size + 1)
+    ]
+    # Directories are walked without recursion, a None entry meaning "cd .."
+    to_visit: list[int | None] = [0]
+    while to_visit:
+        directory = to_visit.pop()
+        if directory is None:
+            yield "$ cd .."
+            continue
+        yield f"$ cd {names[directory]}"
+        yield "$ ls"
+        for child in children[directory]:
+            yield f"dir {names[child]}"
+        for file_idx in range(rng.randint(0, 4)):
+            extension = rng.choice(("", ".txt", ".dat", ".log"))
+            yield f"{rng.randint(1, 300_000)} {random_name(rng)}{file_idx}{extension}"
+        for child in reversed(children[directory]):
+            to_visit.extend((None, child))
+
+
+def generate_trees(size: int, rng: random.Random) -> Lines:
+    """A size x size grid of trees."""
+    heights = numpy_rng(rng).integers(0, 10, size=(size, size), dtype="uint8")
+    for row in heights + ord("0"):
+        yield row.tobytes().decode()
+
+
+def generate_rope_moves(size: int, rng: random.Random) -> Lines:
+    """size head moves."""
+    for _ in range(size):
+        yield f"{rng.choice('RLUD')} {rng.randint(1, 20)}"
+
+
+def generate_program(size: int, rng: random.Random) -> Lines:
+    """size instructions."""
+    register = 1
+    for _ in range(size):
+        if rng.random() < 0.3:
+            yield "noop"
+            continue
+        # Keep the sprite around the screen
+        value = (
+            rng.randint(1, 10) * (1 if register < 20 else -1) * rng.choice((1, 1, -1))
+        )
+        register += value
+        yield f"addx {value}"
+
+
+def generate_monkeys(size: int, rng: random.Random, monkeys_count: int = 8) -> Lines:
+    """size items (at least one per monkey), held by monkeys_count monkeys."""
+    if monkeys_count < 2:
+        raise ValueError("At least two monkeys are needed")
+    primes = [n for n in range(2, 1000) if all(n % d for d in range(2, n))]
+    if monkeys_count > len(primes):
+        raise ValueError(f"At most {len(primes)} monkeys are supported")
+    if size < monkeys_count:
+        raise ValueError("Every monkey must start with an item")
+    items = [[rng.randint(50, 99)] for _ in range(monkeys_count)]
+    for _ in range(size - monkeys_count):
+        rng.choice(items).append(rng.randint(50, 99))
+    # Like in the puzzle, a single monkey squares the worry levels
+    squaring_monkey = rng.randrange(monkeys_count)
+    for mid, divisor in enumerate(rng.sample(primes[:monkeys_count], k=monkeys_count)):
+        if mid == squaring_monkey:
+            operation = "* old"
+        else:
+            operation = rng.choice(
+                (f"* {rng.randint(2, 19)}", f"+ {rng.randint(1, 8)}")
+            )
+        others = [other for other in range(monkeys_count) if other != mid]
+        truthy_mid, falsy_mid = (
+            rng.sample(others, k=2) if len(others) > 1 else others * 2
+        )
+        if mid:
+            yield ""
+        yield f"Monkey {mid}:"
+        yield f"  Starting items: {', '.join(map(str, items[mid]))}"
+        yield f"  Operation: new = old {operation}"
+        yield f"  Test: divisible by {divisor}"
+        yield f"    If true: throw to monkey {truthy_mid}"
+        yield f"    If false: throw to monkey {falsy_mid}"
+
+
+def generate_heightmap(size: int, rng: random.Random) -> Lines:
+    """
+    A size x size heightmap. The start is at the top left corner and the end at the
+    bottom right one, they are connected by a path climbing gently along the
+    borders.
+    """
+    import numpy as np
+
+    path_length = 2 * size - 1
+    if path_length < 27:
+        raise ValueError("Heightmap size must be at least 14")
+    x, y = np.indices((size, size))
+    # Heights grow from the start to the end, with noise making cliffs
+    heights = 1 + (x + y) * 25 // (path_length - 1)
+    heights += numpy_rng(rng).integers(-3, 4, size=(size, size))
+    heights = np.clip(heights, 1, 26)
+    # The path goes along the first row then the last column, the point before the
+    # end being at the highest height
+    path_heights = 1 + np.arange(path_length - 1) * 25 // (path_length - 2)
+    heights[0, :] = path_heights[:size]
+    heights[1:, -1] = np.append(path_heights[size:], 27)
+    heights[0, 0] = 0
+    chars = np.frombuffer(("S" + string.ascii_lowercase + "E").encode(), dtype="uint8")
+    for row in chars[heights]:
+        yield row.tobytes().decode()
+
+
+def random_packet(rng: random.Random, depth: int) -> list:
+    """A packet nested exactly depth times."""
+    packet: list = []
+    if depth > 1:
+        # At least one element goes as deep as required
+        packet.append(random_packet(rng, depth - 1))
+    for _ in range(rng.randint(0, 4)):
+        if depth > 1 and rng.random() < 0.3:
+            # Other nested packets stay shallow, or packets would grow
+            # exponentially with the depth
+            packet.append(random_packet(rng, rng.randint(1, min(depth - 1, 3))))
+        else:
+            packet.append(rng.randint(0, 10))
+    rng.shuffle(packet)
+    return packet
+
+
+def generate_packets(size: int, rng: random.Random, max_depth: int = 5) -> Lines:
+    """size pairs of packets, nested up to max_depth times."""
+    if not 0 < max_depth <= MAX_PACKET_DEPTH:
+        raise ValueError(f"Packets depth must be between 1 and {MAX_PACKET_DEPTH}")
+    for pair_idx in range(size):
+        if pair_idx:
+            yield ""
+        for _ in range(2):
+            packet = random_packet(rng, rng.randint(1, max_depth))
+            yield str(packet).replace(" ", "")
+
+
+def generate_cave_scan(size: int, rng: random.Random) -> Lines:
+    """
+    size rock paths (at least 4), in a cave size deep and twice as wide (the width
+    of the sand pile when it reaches the floor).
+    """
+    if size < 4:
+        raise ValueError("At least four rock paths are needed")
+    min_x, max_x = 500 - size, 500 + size
+    # A bowl right under the source of sand keeps it from falling straight into
+    # the abyss, it's narrow enough for the sand to overflow before the pile above
+    # it reaches the source.
+    bowl_min_x, bowl_max_x = 500 - size // 4, 500 + size // 4
+    bowl_top, bowl_bottom = size // 2 + 2, size + 1
+    yield (
+        f"{bowl_min_x},{bowl_top} -> {bowl_min_x},{bowl_bottom}"
+        f" -> {bowl_max_x},{bowl_bottom} -> {bowl_max_x},{bowl_top}"
+    )
+    # Other rocks are below the top of the bowl and keep the columns along its
+    # outer walls free: the sand overflowing the bowl falls along them into the
+    # abyss, whatever the rocks it met before.
+    chutes = (bowl_min_x - 1, bowl_max_x + 1)
+    paths_count = 1
+    while paths_count < size:
+        x, y = rng.randint(min_x, max_x), rng.randint(bowl_top + 1, bowl_bottom)
+        points = [(x, y)]
+        for segment in range(rng.randint(1, 6)):
+            length = rng.randint(1, 10) * rng.choice((1, -1))
+            if segment % 2:
+                y = min(max(y + length, bowl_top + 1), bowl_bottom)
+            else:
+                x = min(max(x + length, min_x), max_x)
+            points.append((x, y))
+        xs = tuple(x for x, _ in points)
+        if any(min(xs) <= chute <= max(xs) for chute in chutes):
+            continue
+        paths_count += 1
+        yield " -> ".join(f"{x},{y}" for x, y in points)
+
+
+def generate_sensors(
+    size: int, rng: random.Random, search_range: int = 4_000_000
+) -> Lines:
+    """
+    size sensors (at least 4), leaving a single location uncovered in the search
+    range.
+    """
+    if size < 4:
+        raise ValueError("At least four sensors are needed")
+    distress_x, distress_y = rng.randint(1, search_range - 1), rng.randint(
+        1, search_range - 1
+    )
+    sensors = []
+    # The distress beacon is right out of the range of four sensors placed
+    # diagonally around it, that together cover the rest of the search range.
+    for dx, dy in ((1, 1), (1, -1), (-1, 1), (-1, -1)):
+        sensor = (distress_x + dx * search_range, distress_y + dy * search_range)
+        beacon = (sensor[0] - dx * (2 * search_range - 1), sensor[1])
+        sensors.append((sensor, beacon))
+    # Other sensors don't reach the distress beacon either
+    while len(sensors) < size:
+        x, y = rng.randint(0, search_range), rng.randint(0, search_range)
+        distance = abs(x - distress_x) + abs(y - distress_y)
+        if distance < 2:
+            continue
+        sensor_range = rng.randint(distance // 2 or 1, distance - 1)
+        dx = rng.randint(-sensor_range, sensor_range)
+        dy = (sensor_range - abs(dx)) * rng.choice((1, -1))
+        sensors.append(((x, y), (x + dx, y + dy)))
+    rng.shuffle(sensors)
+    for (s_x, s_y), (b_x, b_y) in sensors:
+        yield f"Sensor at x={s_x}, y={s_y}: closest beacon is at x={b_x}, y={b_y}"
+
+
+def generate_valves(
+    size: int, rng: random.Random, flow_valves: int | None = None
+) -> Lines:
+    """
+    size valves, flow_valves of them having a flow (by default a quarter of them,
+    up to 15 like in the puzzle).
+    """
+    if not 1 < size <= len(VALVE_NAMES):
+        raise ValueError(f"Valves count must be between 2 and {len(VALVE_NAMES)}")
+    if flow_valves is None:
+        flow_valves = min(max(size // 4, 1), 15)
+    names = ["AA"] + rng.sample(VALVE_NAMES[1:], k=size - 1)
+    # A spanning tree keeps all the valves reachable, it's made of long corridors
+    # (each valve is linked to one of the few previous ones) so that valves are
+    # several minutes away from each other like in the puzzle. A few more tunnels
+    # make loops.
+    tunnels: list[set[str]] = [set() for _ in range(size)]
+    edges = [
+        (valve, rng.randrange(max(valve - 3, 0), valve)) for valve in range(1, size)
+    ]
+    edges += [
+        (valve, rng.randrange(max(valve - 6, 0), valve))
+        for valve in rng.choices(range(1, size), k=size // 8)
+    ]
+    for valve, other in edges:
+        tunnels[valve].add(names[other])
+        tunnels[other].add(names[valve])
+    flows = [0] * size
+    for valve in rng.sample(range(1, size), k=min(flow_valves, size - 1)):
+        flows[valve] = rng.randint(1, 25)
+    for name, flow, neighbors in zip(names, flows, tunnels):
+        neighbors = sorted(neighbors)
+        if len(neighbors) == 1:
+            tunnels_desc = f"tunnel leads to valve {neighbors[0]}"
+        else:
+            tunnels_desc = f"tunnels lead to valves {', '.join(neighbors)}"
+        yield f"Valve {name} has flow rate={flow}; {tunnels_desc}"
+
+
+GENERATORS: dict[int, InputGenerator] = {
+    1: generate_calories,
+    2: generate_strategy_guide,
+    3: generate_rucksacks,
+    4: generate_assignments,
+    5: generate_crates,
+    6: generate_datastream,
+    7: generate_terminal_session,
+    8: generate_trees,
+    9: generate_rope_moves,
+    10: generate_program,
+    11: generate_monkeys,
+    12: generate_heightmap,
+    13: generate_packets,
+    14: generate_cave_scan,
+    15: generate_sensors,
+    16: generate_valves,
+}
+
+
+def generate_lines(day: int, size: int, seed: int | None = None, **params) -> Lines:
+    return GENERATORS[day](size, random.Random(seed), **params)
+
+
+def write_input(
+    path: str, day: int, size: int, seed: int | None = None, **params
+) -> None:
+    """Writes a generated input, lines being written by batches."""
+    with open(path, "w") as f:
+        for batch in batchify(generate_lines(day, size, seed, **params), 10_000):
+            f.write("\n".join(batch))
+            f.write("\n")
+
+
+def parse_param(text: str) -> tuple[str, int]:
+    name, value = text.split("=")
+    return name, int(value)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("day", type=int, choices=sorted(GENERATORS))
+    parser.add_argument("size", type=int)
+    parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument(
+        "--param",
+        nargs="+",
+        default=[],
+        type=parse_param,
+        metavar="NAME=VALUE",
+        help="extra generator parameters, e.g. max_depth=50 for day 13",
+    )
+    args = parser.parse_args(argv)
+    params = dict(args.param)
+    if args.output:
+        write_input(args.output, args.day, args.size, seed=args.seed, **params)
+    else:
+        for line in generate_lines(args.day, args.size, seed=args.seed, **params):
+            sys.stdout.write(line + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Metrics and progress reporting of the solutions, enabled with the runner
+--metrics option or the AOC_METRICS environment variable, e.g.:
+    python runner.py 15 --metrics progress,metrics.jsonl
+    AOC_METRICS=metrics.jsonl python runner.py 16
+    cd day-15 && AOC_METRICS=progress python solution.py
+
+Solutions call count, gauge, progress and timed_phase, which do nothing until
+sinks are enabled. Only entry points (the runner's processes and the solutions
+run directly) enable them, importing this module never does.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+from typing import ContextManager, Generator, NamedTuple, Protocol
+
+# Metrics are emitted to the sinks listed in AOC_METRICS (see enable_metrics)
+METRICS_ENV = "AOC_METRICS"
+
+
+class MetricEvent(NamedTuple):
+    kind: str  # "counter", "gauge", "progress" or "phase"
+    name: str
+    value: float  # total for counters, seconds for phases
+    total: float | None = None  # progress only
+    time: float = 0.0  # timestamp
+
+
+class MetricsSink(Protocol):
+    def emit(self, event: MetricEvent) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class JsonLinesSink:
+    """Appends events to a file, one JSON object per line."""
+
+    def __init__(self, path: str):
+        # Line buffered so that processes appending to the same file don't
+        # interleave partial lines
+        self.file = open(path, "a", buffering=1)
+
+    def emit(self, event: MetricEvent) -> None:
+        import json
+
+        self.file.write(json.dumps({**event._asdict(), "pid": os.getpid()}) + "\n")
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class ProgressBarSink:
+    """
+    Draws progress events as a bar on stderr. The end of a phase ends the line
+    of a bar left unfinished (e.g. when a search stops early), other events are
+    ignored.
+    """
+
+    def __init__(self, width: int = 40):
+        self.width = width
+        self.drawn: dict[str, int] = {}
+        self.unfinished = False
+
+    def emit(self, event: MetricEvent) -> None:
+        if event.kind == "phase" and self.unfinished:
+            self.end_line()
+        if event.kind != "progress" or not event.total:
+            return
+        filled = int(self.width * event.value / event.total)
+        # Only redrawn when the bar changes
+        if self.drawn.get(event.name) == filled:
+            return
+        self.drawn[event.name] = filled
+        bar = "#" * filled + "." * (self.width - filled)
+        print(
+            f"\r{event.name} [{bar}] {event.value:g}/{event.total:g}",
+            end="",
+            file=sys.stderr,
+            flush=True,
+        )
+        self.unfinished = event.value < event.total
+        if not self.unfinished:
+            self.end_line()
+
+    def end_line(self) -> None:
+        print(file=sys.stderr, flush=True)
+        self.drawn.clear()
+        self.unfinished = False
+
+    def close(self) -> None:
+        if self.unfinished:
+            self.end_line()
+
+
+# Metrics functions return right away while there is no sink, so that solutions
+# can call them in their loops at (almost) no cost.
+_metrics_sinks: list[MetricsSink] = []
+_counters: dict[str, float] = {}
+
+
+def enable_metrics(spec: str) -> None:
+    """
+    Adds the sinks of a comma separated spec: "progress" for a progress bar on
+    stderr, anything else being the path of a JSON lines file.
+    """
+    for target in filter(None, spec.split(",")):
+        if target == "progress":
+            _metrics_sinks.append(ProgressBarSink())
+        else:
+            _metrics_sinks.append(JsonLinesSink(target))
+
+
+def enable_metrics_from_env() -> None:
+    """
+    Adds the sinks of the AOC_METRICS spec, if set. Meant for entry points such
+    as the solutions run directly, e.g. AOC_METRICS=progress python solution.py.
+    Sinks are closed when the interpreter exits.
+    """
+    if os.environ.get(METRICS_ENV):
+        enable_metrics(os.environ[METRICS_ENV])
+        atexit.register(disable_metrics)
+
+
+def disable_metrics() -> None:
+    for sink in _metrics_sinks:
+        sink.close()
+    _metrics_sinks.clear()
+    _counters.clear()
+
+
+def metrics_enabled() -> bool:
+    return bool(_metrics_sinks)
+
+
+def emit_metric(kind: str, name: str, value: float, total: float | None = None) -> None:
+    event = MetricEvent(kind, name, value, total, time.time())
+    for sink in _metrics_sinks:
+        sink.emit(event)
+
+
+def count(name: str, increment: float = 1) -> None:
+    """Increments a counter, its running total is emitted."""
+    if not _metrics_sinks:
+        return
+    _counters[name] = _counters.get(name, 0) + increment
+    emit_metric("counter", name, _counters[name])
+
+
+def gauge(name: str, value: float) -> None:
+    if not _metrics_sinks:
+        return
+    emit_metric("gauge", name, value)
+
+
+def progress(name: str, done: float, total: float) -> None:
+    if not _metrics_sinks:
+        return
+    emit_metric("progress", name, done, total)
+
+
+def timed_phase(name: str) -> ContextManager[None]:
+    """Emits the duration of the code run in the context."""
+    if not _metrics_sinks:
+        return nullcontext()
+    return _timed_phase(name)
+
+
+@contextmanager
+def _timed_phase(name: str) -> Generator[None, None, None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        emit_metric("phase", name, time.perf_counter() - start)
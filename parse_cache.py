@@ -0,0 +1,228 @@
+"""
+Cache of parsed inputs, enabled with the cache argument of utils.parse_input and
+utils.load_ints or the AOC_PARSE_CACHE environment variable (set to a non empty
+value).
+
+Parsed inputs are pickled in the "parse" cache directory (see utils.cache_dir),
+keyed by the input content, the separator, the parse function and the sources
+of the project modules it may depend on. Out-of-band
+buffers such as NumPy arrays data are stored as is so that they're loaded
+without copies.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+import sys
+from contextlib import suppress
+from types import ModuleType
+from typing import Any, Callable, TypeVar
+
+from utils import cache_dir
+
+T = TypeVar("T")
+PARSE_CACHE_ENV = "AOC_PARSE_CACHE"
+# Out-of-band buffers are aligned in cache files so that arrays loaded from them
+# are aligned too
+CACHE_BUFFER_ALIGNMENT = 64
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def is_parse_cache_enabled(cache: bool | None = None) -> bool:
+    if cache is None:
+        return bool(os.environ.get(PARSE_CACHE_ENV))
+    return cache
+
+
+def cached_parse(
+    path: str, parse: Callable[[bytes], T], sep: str, parse_fn: Callable
+) -> T:
+    """
+    Parses the content of an input file, or loads from the cache the result of a
+    previous parsing of the same content with the same separator and parse
+    function.
+    """
+    import pickle
+
+    with open(path, "rb") as f:
+        content = f.read()
+    cache_path = os.path.join(
+        cache_dir("parse"), parse_cache_key(content, sep, parse_fn) + ".bin"
+    )
+    try:
+        return load_cached(cache_path)
+    except (
+        OSError,
+        EOFError,
+        ValueError,
+        AttributeError,
+        struct.error,
+        pickle.UnpicklingError,
+    ):
+        # Missing or corrupted entry, or classes of the parsed content have been
+        # moved/renamed since it was stored
+        pass
+    parsed = parse(content)
+    store_cached(cache_path, parsed)
+    return parsed
+
+
+def parse_cache_key(content: bytes, sep: str, parse_fn: Callable) -> str:
+    """
+    Hash of everything the parsed lines depend on. The parse function is identified
+    by its fingerprint along with the sources of the module defining it and of the
+    project modules this one imports from (see module_sources), so that changing
+    the function or any other it calls from these modules invalidates the cache.
+    """
+    import hashlib
+
+    key = hashlib.sha256(content)
+    key.update(f"\0{sep}\0{callable_fingerprint(parse_fn)}\0".encode())
+    for path in module_sources(getattr(parse_fn, "__module__", None)):
+        with open(path, "rb") as f:
+            key.update(f.read())
+    return key.hexdigest()
+
+
+def module_sources(module_name: str | None) -> list[str]:
+    """
+    Source files of a module and of the project modules it imports from (e.g.
+    utils.py for the solutions), along with this module's, sorted by path.
+    Modules imported from within functions aren't found.
+    """
+    paths = {os.path.abspath(__file__)}
+    module = sys.modules.get(module_name)
+    if module is None:
+        return sorted(paths)
+    for value in (module, *vars(module).values()):
+        if not isinstance(value, ModuleType):
+            value = sys.modules.get(getattr(value, "__module__", None))
+        path = getattr(value, "__file__", None)
+        if path and os.path.abspath(path).startswith(PROJECT_DIR + os.sep):
+            paths.add(os.path.abspath(path))
+    return sorted(paths)
+
+
+def callable_fingerprint(fn: Any, _seen: frozenset[int] = frozenset()) -> str:
+    """
+    Description of what a callable computes: its name, plus for functions their
+    bytecode, constants, referenced names, defaults and closure values, so that
+    lambdas or closures sharing a name get different fingerprints. Partial
+    functions are described by their function and arguments.
+    Values that can't be pickled are described by their repr, which makes
+    fingerprints change on each run when it shows an address (i.e. cache misses).
+    """
+    import functools
+
+    if id(fn) in _seen:
+        # Recursive closure
+        return "..."
+    _seen |= {id(fn)}
+    if isinstance(fn, functools.partial):
+        return (
+            f"partial({callable_fingerprint(fn.func, _seen)}, "
+            f"{_value_fingerprint(fn.args, _seen)}, "
+            f"{_value_fingerprint(fn.keywords, _seen)})"
+        )
+    qualname = getattr(fn, "__qualname__", None)
+    code = getattr(fn, "__code__", None)
+    if code is None:
+        # Classes and builtins are identified by their name only
+        return f"{getattr(fn, '__module__', None)}.{qualname}" if qualname else repr(fn)
+    closure_values = []
+    for cell in fn.__closure__ or ():
+        try:
+            closure_values.append(_value_fingerprint(cell.cell_contents, _seen))
+        except ValueError:  # Cell not assigned yet
+            closure_values.append("<empty>")
+    return (
+        f"{fn.__module__}.{qualname}({_code_fingerprint(code)}, "
+        f"{_value_fingerprint((fn.__defaults__, fn.__kwdefaults__), _seen)}, "
+        f"{closure_values})"
+    )
+
+
+def _code_fingerprint(code: Any) -> str:
+    # Nested code objects (e.g. of lambdas) have a repr showing their address
+    consts = tuple(
+        _code_fingerprint(const) if hasattr(const, "co_code") else repr(const)
+        for const in code.co_consts
+    )
+    return f"{code.co_code.hex()}, {consts}, {code.co_names}"
+
+
+def _value_fingerprint(value: Any, seen: frozenset[int]) -> str:
+    import hashlib
+    import pickle
+
+    if callable(value):
+        return callable_fingerprint(value, seen)
+    try:
+        return hashlib.sha256(pickle.dumps(value, protocol=5)).hexdigest()
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return repr(value)
+
+
+def store_cached(path: str, value: Any) -> bool:
+    """
+    Pickles the value into a cache file, buffers such as NumPy arrays data are
+    written out-of-band (as is, after the pickle stream) rather than copied into
+    it. Returns whether the value could be stored.
+    """
+    import pickle
+
+    buffers: list[pickle.PickleBuffer] = []
+    try:
+        payload = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return False
+    raw_buffers = [buffer.raw() for buffer in buffers]
+    header = struct.pack(
+        f"<{len(raw_buffers) + 2}Q",
+        len(raw_buffers),
+        len(payload),
+        *(len(raw) for raw in raw_buffers),
+    )
+    # Written to a temporary file first so that readers never see partial files
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(header)
+            f.write(payload)
+            for raw in raw_buffers:
+                f.write(b"\0" * (-f.tell() % CACHE_BUFFER_ALIGNMENT))
+                f.write(raw)
+        os.replace(tmp_path, path)
+    except OSError:
+        # Read-only or full disk, the value is just not cached
+        return False
+    finally:
+        # Left behind when writing or renaming failed
+        with suppress(OSError):
+            os.unlink(tmp_path)
+    return True
+
+
+def load_cached(path: str) -> Any:
+    """Loads a value stored by store_cached."""
+    import pickle
+
+    with open(path, "rb") as f:
+        # Out-of-band buffers are views on the file content, which is loaded in a
+        # bytearray so that they are writable.
+        content = bytearray(os.fstat(f.fileno()).st_size)
+        f.readinto(content)
+    view = memoryview(content)
+    (buffers_count,) = struct.unpack_from("<Q", view)
+    payload_size, *buffers_sizes = struct.unpack_from(f"<{buffers_count + 1}Q", view, 8)
+    offset = 8 * (buffers_count + 2)
+    payload = view[offset : offset + payload_size]
+    offset += payload_size
+    buffers = []
+    for size in buffers_sizes:
+        offset += -offset % CACHE_BUFFER_ALIGNMENT
+        buffers.append(view[offset : offset + size])
+        offset += size
+    return pickle.loads(payload, buffers=buffers)
@@ -0,0 +1,121 @@
+"""
+Instrumentation of the parsing and solving phases of the solutions, enabled with
+the runner --profile option or the AOC_PROFILE_DIR environment variable, e.g.:
+    python runner.py 14 --profile profiles
+    python -m pstats profiles/day-14.part-1.solve.pstats
+
+Each phase writes two reports in the profile directory:
+- <name>.pstats: cProfile stats, to be explored with pstats or snakeviz
+- <name>.json: wall/CPU time, RSS delta, tracemalloc peak along with the top
+  allocation sites of the memory still allocated at the end of the phase (e.g.
+  the parsed input) and the top functions by cumulative time
+
+Phases run a lot slower when profiled (both cProfile and tracemalloc hook into
+every call/allocation), timings are only meaningful relatively to each other.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import json
+import os
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from typing import Any, ContextManager, Generator
+
+PROFILE_DIR_ENV = "AOC_PROFILE_DIR"
+TOP_COUNT = 10
+# Allocations made by the instrumentation itself are not reported
+IGNORED_ALLOCATIONS = (
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+)
+
+
+def current_rss() -> int:
+    """Resident set size of the process in bytes (the peak one if unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import resource
+
+        # ru_maxrss is in kilobytes on Linux (and bytes on macOS)
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def top_functions(profiler: cProfile.Profile) -> list[dict[str, Any]]:
+    stats = pstats.Stats(profiler).stats
+    # Stats rows are (primitive calls, calls, total time, cumulative time, callers)
+    by_cumulative_time = sorted(
+        stats.items(), key=lambda item: item[1][3], reverse=True
+    )
+    functions = []
+    for (filename, line, name), row in by_cumulative_time[:TOP_COUNT]:
+        _, calls, total_time, cumulative_time, _ = row
+        functions.append(
+            {
+                "function": f"{filename}:{line}({name})",
+                "calls": calls,
+                "total_time": total_time,
+                "cumulative_time": cumulative_time,
+            }
+        )
+    return functions
+
+
+def top_allocations(snapshot: tracemalloc.Snapshot) -> list[dict[str, Any]]:
+    statistics = snapshot.filter_traces(IGNORED_ALLOCATIONS).statistics("lineno")
+    return [
+        {
+            "location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+            "size": stat.size,
+            "count": stat.count,
+        }
+        for stat in statistics[:TOP_COUNT]
+    ]
+
+
+@contextmanager
+def profile_phase(report_dir: str, name: str) -> Generator[None, None, None]:
+    """Profiles the code run in the context and writes its reports."""
+    os.makedirs(report_dir, exist_ok=True)
+    profiler = cProfile.Profile()
+    rss_before = current_rss()
+    tracemalloc.start()
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        wall_time = time.perf_counter() - wall_start
+        cpu_time = time.process_time() - cpu_start
+        snapshot = tracemalloc.take_snapshot()
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        report = {
+            "name": name,
+            "wall_time": wall_time,
+            "cpu_time": cpu_time,
+            "rss_delta": current_rss() - rss_before,
+            "tracemalloc_peak": peak_memory,
+            "top_allocations": top_allocations(snapshot),
+            "top_functions": top_functions(profiler),
+        }
+        profiler.dump_stats(os.path.join(report_dir, f"{name}.pstats"))
+        with open(os.path.join(report_dir, f"{name}.json"), "w") as f:
+            json.dump(report, f, indent=2)
+
+
+def profiled(
+    report_dir: str | None, day: int, part: int, phase: str
+) -> ContextManager[None]:
+    """profile_phase for a phase of a day part, a no-op without report dir."""
+    if report_dir is None:
+        return nullcontext()
+    return profile_phase(report_dir, f"day-{day:02d}.part-{part}.{phase}")
@@ -0,0 +1,220 @@
+"""
+Runs the solutions of several days at once, each part in its own process, e.g.:
+    python runner.py          # all days
+    python runner.py 1 12 16  # some days only
+    python runner.py --cache  # reuse the answers cached by previous runs
+    python runner.py 14 --profile profiles  # write profiling reports
+    python runner.py 15 --metrics progress,metrics.jsonl  # progress bar and metrics
+
+Every day-XX/solution.py module is expected to provide a parse(path) function
+(and optionally parse_part_2(path) when the second part parses the input
+differently) along with solve_part_1 and solve_part_2 functions taking the parsed
+input.
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import importlib.util
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from types import ModuleType
+from typing import Any, Callable, Iterable, NamedTuple
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+# Solutions import utils from the root directory
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from answer_cache import AnswerCache, answer_key  # noqa: E402
+from metrics import METRICS_ENV, enable_metrics, timed_phase  # noqa: E402
+from profiling import PROFILE_DIR_ENV, profiled  # noqa: E402
+
+PARTS = (1, 2)
+
+_solutions: dict[int, ModuleType] = {}
+_answer_cache: AnswerCache | None = None
+
+
+class PartResult(NamedTuple):
+    day: int
+    part: int
+    answer: Any
+    parse_time: float  # seconds
+    solve_time: float  # seconds
+    cached: bool = False
+
+
+def discover_days() -> tuple[int, ...]:
+    """Returns the days having a solution."""
+    paths = glob.glob(os.path.join(ROOT_DIR, "day-*", "solution.py"))
+    return tuple(
+        sorted(int(os.path.basename(os.path.dirname(path))[4:]) for path in paths)
+    )
+
+
+def day_dir(day: int) -> str:
+    return os.path.join(ROOT_DIR, f"day-{day:02d}")
+
+
+def load_solution(day: int) -> ModuleType:
+    """Imports (once per process) the solution module of the day."""
+    if day not in _solutions:
+        name = f"day_{day:02d}_solution"
+        spec = importlib.util.spec_from_file_location(
+            name, os.path.join(day_dir(day), "solution.py")
+        )
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+        _solutions[day] = module
+    return _solutions[day]
+
+
+def get_parser(solution: ModuleType, part: int) -> Callable[[str], Any]:
+    return getattr(solution, f"parse_part_{part}", solution.parse)
+
+
+def get_solver(solution: ModuleType, part: int) -> Callable[[Any], Any]:
+    return getattr(solution, f"solve_part_{part}")
+
+
+def get_answer_cache() -> AnswerCache:
+    """The answer cache of the process, opened on first use."""
+    global _answer_cache
+    if _answer_cache is None:
+        _answer_cache = AnswerCache()
+    return _answer_cache
+
+
+def run_part(
+    day: int,
+    part: int,
+    input_path: str | None = None,
+    cache: bool = False,
+    profile_dir: str | None = None,
+    **solve_kwargs: Any,
+) -> PartResult:
+    """
+    Parses the input and solves a part of the day. The input is parsed again for
+    each part since some solutions mutate their parsed input.
+    Extra keyword arguments are given to the solver. With cache, the answer is
+    looked up in the answer cache first (parse time is then 0 and solve time is
+    the lookup time), and stored there after solving.
+    With a profile directory (AOC_PROFILE_DIR by default), profiling reports of
+    both phases are written there.
+    """
+    profile_dir = profile_dir or os.environ.get(PROFILE_DIR_ENV)
+    solution = load_solution(day)
+    input_path = input_path or os.path.join(day_dir(day), "input")
+    if cache:
+        start = time.perf_counter()
+        key = answer_key(solution, part, input_path, solve_kwargs)
+        found, answer = get_answer_cache().lookup(key)
+        if found:
+            return PartResult(day, part, answer, 0, time.perf_counter() - start, True)
+    with (
+        profiled(profile_dir, day, part, "parse"),
+        timed_phase(f"day {day:02d} part {part} parse"),
+    ):
+        start = time.perf_counter()
+        data = get_parser(solution, part)(input_path)
+        parsed = time.perf_counter()
+    with (
+        profiled(profile_dir, day, part, "solve"),
+        timed_phase(f"day {day:02d} part {part} solve"),
+    ):
+        solve_start = time.perf_counter()
+        answer = get_solver(solution, part)(data, **solve_kwargs)
+        solved = time.perf_counter()
+    if cache:
+        get_answer_cache().store(key, day, part, input_path, answer)
+    return PartResult(day, part, answer, parsed - start, solved - solve_start)
+
+
+def run_days(
+    days: Iterable[int],
+    workers: int | None = None,
+    cache: bool = False,
+    profile_dir: str | None = None,
+    metrics: str | None = None,
+) -> list[PartResult]:
+    """
+    Runs all the parts of the days in parallel, results are sorted by day/part.
+    Metrics emitted by the solutions are sent to the sinks of the metrics spec
+    (AOC_METRICS by default, see metrics.enable_metrics), enabled in the processes
+    running the parts only.
+    """
+    metrics = metrics or os.environ.get(METRICS_ENV)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=enable_metrics if metrics else None,
+        initargs=(metrics,) if metrics else (),
+    ) as executor:
+        futures = [
+            executor.submit(run_part, day, part, cache=cache, profile_dir=profile_dir)
+            for day in days
+            for part in PARTS
+        ]
+        results = [future.result() for future in as_completed(futures)]
+    return sorted(results, key=lambda result: (result.day, result.part))
+
+
+def format_answer(answer: Any) -> str:
+    # Some answers are drawn on several lines (e.g. day 10 part 2)
+    if isinstance(answer, (list, tuple)):
+        return "\n" + "\n".join(str(line) for line in answer)
+    return str(answer)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("days", nargs="*", type=int, help="days to run (default: all)")
+    parser.add_argument(
+        "-w", "--workers", type=int, help="number of processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "--cache", action="store_true", help="use and fill the answer cache"
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="DIR",
+        help="write profiling reports of each phase in this directory",
+    )
+    parser.add_argument(
+        "--metrics",
+        metavar="SPEC",
+        help='metrics sinks: "progress" and/or JSON lines files, comma separated'
+        " (default: AOC_METRICS)",
+    )
+    args = parser.parse_args(argv)
+    days = args.days or discover_days()
+
+    start = time.perf_counter()
+    results = run_days(
+        days,
+        workers=args.workers,
+        cache=args.cache,
+        profile_dir=args.profile,
+        metrics=args.metrics,
+    )
+    wall_time = time.perf_counter() - start
+    for result in results:
+        timing = (
+            f"cached, {result.solve_time * 1e6:.0f}µs"
+            if result.cached
+            else f"parse {result.parse_time:.3f}s, solve {result.solve_time:.3f}s"
+        )
+        print(
+            f"Day {result.day:02d} part {result.part}:"
+            f" {format_answer(result.answer)} ({timing})"
+        )
+    cumulated_time = sum(r.parse_time + r.solve_time for r in results)
+    print(f"Total: {wall_time:.3f}s wall time ({cumulated_time:.3f}s cumulated)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from answer_cache import AnswerCache, answer_key
+from runner import load_solution
+
+
+class TestAnswerCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache = AnswerCache(os.path.join(self.tmp_dir, "answers.sqlite"))
+
+    def tearDown(self):
+        self.cache.close()
+        shutil.rmtree(self.tmp_dir)
+
+    def test_lookup(self):
+        self.assertEqual(self.cache.lookup("key"), (False, None))
+        self.cache.store("key", 10, 2, "input", ["#..", ".##"])
+        self.assertEqual(self.cache.lookup("key"), (True, ["#..", ".##"]))
+
+    def test_eviction(self):
+        self.cache.max_bytes = 300  # 3 answers
+        for idx in range(4):
+            self.cache.store(f"key{idx}", 1, 1, "input", "x" * 80)
+            if idx == 1:
+                # The first answer becomes more recently used than the second one
+                self.cache.lookup("key0")
+        self.assertEqual(len(self.cache.entries()), 3)
+        self.assertEqual(self.cache.lookup("key1"), (False, None))
+        self.assertTrue(self.cache.lookup("key0")[0])
+
+    def test_purge(self):
+        for day in (1, 1, 2):
+            self.cache.store(f"key{len(self.cache.entries())}", day, 1, "input", 0)
+        self.assertEqual(self.cache.purge(day=1), 2)
+        self.assertEqual([entry.day for entry in self.cache.entries()], [2])
+        self.assertEqual(self.cache.purge(), 1)
+
+    def test_answer_key(self):
+        solution = load_solution(15)
+        key = answer_key(solution, 1, "day-15/test_input", {"row_idx": 10})
+        self.assertEqual(
+            key, answer_key(solution, 1, "day-15/test_input", {"row_idx": 10})
+        )
+        for other_key in (
+            answer_key(solution, 2, "day-15/test_input", {"row_idx": 10}),
+            answer_key(solution, 1, "day-15/input", {"row_idx": 10}),
+            answer_key(solution, 1, "day-15/test_input", {"row_idx": 11}),
+            answer_key(load_solution(14), 1, "day-15/test_input", {"row_idx": 10}),
+        ):
+            self.assertNotEqual(key, other_key)
+        # Another NumPy version (or Python version) invalidates the answers
+        with mock.patch("answer_cache.runtime_versions", return_value="3.0 numpy 0.1"):
+            self.assertNotEqual(
+                key, answer_key(solution, 1, "day-15/test_input", {"row_idx": 10})
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
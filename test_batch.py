@@ -0,0 +1,56 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from batch import expand_inputs, run_batch, solve_input, write_records
+from generators import write_input
+from runner import run_part
+
+
+class TestBatch(unittest.TestCase):
+    def test_expand_inputs(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for name in ("b.txt", "a.txt", "c.log"):
+                open(os.path.join(tmp_dir, name), "w").close()
+            os.mkdir(os.path.join(tmp_dir, "subdir"))
+            names = ["a.txt", "b.txt", "c.log"]
+            self.assertEqual(
+                expand_inputs([tmp_dir]), [os.path.join(tmp_dir, n) for n in names]
+            )
+            self.assertEqual(
+                expand_inputs([os.path.join(tmp_dir, "*.txt")]),
+                [os.path.join(tmp_dir, n) for n in names[:2]],
+            )
+
+    def test_solve_input(self):
+        record = solve_input(1, "day-01/test_input")
+        self.assertEqual(record["answers"], {"1": 24000, "2": 45000})
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "input")
+            with open(path, "w") as f:
+                f.write("not a number\n")
+            record = solve_input(1, path)
+        self.assertNotIn("answers", record)
+        self.assertTrue(record["error"].startswith("ValueError"))
+
+    def test_run_batch(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = [os.path.join(tmp_dir, str(seed)) for seed in range(5)]
+            for seed, path in enumerate(paths):
+                write_input(path, 8, 20, seed=seed)
+            records = list(run_batch(8, paths, parts=(1,), workers=2, chunksize=2))
+            self.assertEqual([record["input"] for record in records], paths)
+            self.assertEqual(
+                [record["answers"]["1"] for record in records],
+                [run_part(8, 1, path).answer for path in paths],
+            )
+            output = io.StringIO()
+            self.assertEqual(write_records(records, output), 0)
+        lines = output.getvalue().splitlines()
+        self.assertEqual(json.loads(lines[0])["answers"], records[0]["answers"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+
+from bench import (
+    PhaseStats,
+    complexity_exponent,
+    find_regressions,
+    percentile,
+    time_part,
+)
+
+
+class TestBench(unittest.TestCase):
+    def test_time_part(self):
+        times = time_part(1, 1, "day-01/test_input", repeat=3, warmup=1)
+        self.assertEqual(
+            {phase: len(t) for phase, t in times.items()}, {"parse": 3, "solve": 3}
+        )
+
+    def test_percentile(self):
+        self.assertEqual(percentile([float(t) for t in range(100, 0, -1)], 0.95), 95.0)
+        self.assertEqual(percentile([1.0], 0.95), 1.0)
+
+    def test_find_regressions(self):
+        baseline = {
+            "01.1.solve": PhaseStats(0.1, 0.1, 5),
+            "01.1.parse": PhaseStats(0.0001, 0.0001, 5),
+        }
+        results = {
+            "01.1.solve": PhaseStats(0.15, 0.15, 5),
+            "01.1.parse": PhaseStats(0.0005, 0.0005, 5),
+        }
+        # Too fast phases are ignored, whatever their relative slowdown
+        self.assertEqual(
+            find_regressions(results, baseline), {"01.1.solve": (0.1, 0.15)}
+        )
+        self.assertEqual(find_regressions(results, baseline, threshold=0.6), {})
+
+    def test_complexity_exponent(self):
+        sizes = [10, 100, 1000]
+        self.assertAlmostEqual(complexity_exponent(sizes, [s * 0.01 for s in sizes]), 1)
+        self.assertAlmostEqual(complexity_exponent(sizes, [s**2 for s in sizes]), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,21 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from check_startup import import_time, main
+
+
+class TestCheckStartup(unittest.TestCase):
+    def test_import_time(self):
+        self.assertGreater(import_time(1), 0)
+
+    def test_budget(self):
+        with redirect_stdout(io.StringIO()) as output:
+            self.assertEqual(main(["1", "16", "--repeat", "3"]), 0)
+            # Nothing can be imported that fast
+            self.assertEqual(main(["1", "--repeat", "1", "--budget", "0.001"]), 1)
+        self.assertIn("Day 01", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
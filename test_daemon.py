@@ -0,0 +1,65 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from daemon import connect, make_server, send_request
+
+
+class TestDaemon(unittest.TestCase):
+    def serve(self, **kwargs):
+        server = make_server(workers=1, **kwargs)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+
+        def stop():
+            server.shutdown()
+            thread.join()
+            server.server_close()
+
+        self.addCleanup(stop)
+        return server
+
+    def test_unix_socket(self):
+        with open("day-01/test_input") as f:
+            content = f.read()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            socket_path = os.path.join(tmp_dir, "daemon.sock")
+            self.serve(socket_path=socket_path, cache_size=2)
+            with connect(socket_path) as client:
+                request = {"day": 1, "input": content}
+                response = send_request(client, request)
+                self.assertEqual(response["answers"], {"1": 24000, "2": 45000})
+                self.assertFalse(response["cached"])
+                self.assertTrue(send_request(client, request)["cached"])
+                response = send_request(client, {**request, "parts": [2]})
+                self.assertEqual(response, {"answers": {"2": 45000}, "cached": True})
+                # The least recently used answer is evicted by a new one
+                send_request(client, {"day": 1, "parts": [1], "input": "1\n"})
+                self.assertFalse(send_request(client, request)["cached"])
+
+    def test_tcp_errors(self):
+        server = self.serve(port=0)
+        with connect(port=server.server_address[1]) as client:
+            response = send_request(client, {"day": 30, "input": ""})
+            self.assertIn("Unknown day", response["error"])
+            response = send_request(client, {"day": 1, "input": "not a number\n"})
+            self.assertTrue(response["error"].startswith("ValueError"))
+            response = send_request(client, {"day": 1, "parts": [1], "input": "1\n"})
+            self.assertEqual(response["answers"], {"1": 1})
+
+    def test_input_is_not_evaluated(self):
+        server = self.serve(port=0)
+        with tempfile.TemporaryDirectory() as tmp_dir, connect(
+            port=server.server_address[1]
+        ) as client:
+            marker_path = os.path.join(tmp_dir, "marker")
+            packet = f"[open({marker_path!r}, 'w').write('x')]"
+            request = {"day": 13, "parts": [1], "input": f"{packet}\n[1]"}
+            response = send_request(client, request)
+            self.assertTrue(response["error"].startswith("JSONDecodeError"))
+            self.assertFalse(os.path.exists(marker_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import os
+import tempfile
+import unittest
+
+from generators import GENERATORS, MAX_PACKET_DEPTH, generate_lines, write_input
+from runner import load_solution, run_part
+
+SIZES = {7: 50, 8: 20, 11: 16, 12: 20, 14: 30, 15: 20, 16: 40}
+
+
+class TestGenerators(unittest.TestCase):
+    def test_seed(self):
+        lines = tuple(generate_lines(9, 50, seed=1))
+        self.assertEqual(len(lines), 50)
+        self.assertEqual(lines, tuple(generate_lines(9, 50, seed=1)))
+        self.assertNotEqual(lines, tuple(generate_lines(9, 50, seed=2)))
+
+    def test_sizes(self):
+        self.assertEqual(sum(1 for line in generate_lines(1, 1000) if line), 1000)
+        self.assertEqual(len(next(generate_lines(6, 1000))), 1000)
+        self.assertEqual(len(tuple(generate_lines(8, 30))), 30)
+        with self.assertRaises(ValueError):
+            tuple(generate_lines(13, 10, max_depth=1000))
+
+    def test_edge_cases(self):
+        # Stacks of a single crate each are still given crates to move
+        for seed in range(100):
+            lines = tuple(generate_lines(5, 5, seed=seed, stacks_count=2))
+            self.assertTrue(all(line.startswith("move") for line in lines[-5:]))
+        # The deepest packets are still parsed and compared
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "input")
+            write_input(path, 13, 5, seed=1, max_depth=MAX_PACKET_DEPTH)
+            self.assertIsNotNone(run_part(13, 2, path).answer)
+        datastream = next(generate_lines(6, 20, seed=1))
+        self.assertEqual(len(set(datastream[:-1][-14:])), 13)
+        self.assertEqual(len(set(datastream[-14:])), 14)
+
+    def test_generated_inputs_are_solved(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for day in GENERATORS:
+                path = os.path.join(tmp_dir, str(day))
+                if day == 15:
+                    write_input(path, day, SIZES[day], seed=1, search_range=100)
+                    solution = load_solution(day)
+                    sensors_and_beacons = solution.parse(path)
+                    self.assertGreater(
+                        solution.solve_part_1(sensors_and_beacons, row_idx=50), 0
+                    )
+                    self.assertIsNotNone(
+                        solution.solve_part_2(sensors_and_beacons, search_range=100)
+                    )
+                    continue
+                write_input(path, day, SIZES.get(day, 300), seed=1)
+                for part in (1, 2):
+                    with self.subTest(day=day, part=part):
+                        self.assertIsNotNone(run_part(day, part, path).answer)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+
+from metrics import (
+    METRICS_ENV,
+    count,
+    disable_metrics,
+    enable_metrics,
+    gauge,
+    metrics_enabled,
+    progress,
+    timed_phase,
+)
+
+
+class TestMetrics(unittest.TestCase):
+    def tearDown(self):
+        disable_metrics()
+
+    def test_disabled(self):
+        self.assertFalse(metrics_enabled())
+        count("calls")
+        gauge("size", 3)
+        progress("items", 1, 2)
+        with timed_phase("phase"):
+            pass
+
+    def test_json_lines_sink(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "metrics.jsonl")
+            enable_metrics(path)
+            self.assertTrue(metrics_enabled())
+            count("calls")
+            count("calls", 2)
+            gauge("size", 3)
+            progress("items", 1, 2)
+            with timed_phase("phase"):
+                pass
+            disable_metrics()
+            with open(path) as f:
+                events = [json.loads(line) for line in f]
+        self.assertEqual(
+            [(e["kind"], e["name"], e["value"], e["total"]) for e in events[:4]],
+            [
+                ("counter", "calls", 1, None),
+                ("counter", "calls", 3, None),
+                ("gauge", "size", 3, None),
+                ("progress", "items", 1, 2),
+            ],
+        )
+        self.assertEqual((events[4]["kind"], events[4]["name"]), ("phase", "phase"))
+        self.assertGreaterEqual(events[4]["value"], 0)
+
+    def test_progress_bar_sink(self):
+        stderr = io.StringIO()
+        with redirect_stderr(stderr):
+            enable_metrics("progress")
+            for done in range(1, 5):
+                progress("items", done, 4)
+            # Left unfinished, its line is ended by the end of the phase
+            with timed_phase("phase"):
+                progress("other", 1, 3)
+        self.assertEqual(
+            stderr.getvalue().split("\n"),
+            [
+                "\ritems [" + "#" * 10 + "." * 30 + "] 1/4"
+                "\ritems [" + "#" * 20 + "." * 20 + "] 2/4"
+                "\ritems [" + "#" * 30 + "." * 10 + "] 3/4"
+                "\ritems [" + "#" * 40 + "] 4/4",
+                "\rother [" + "#" * 13 + "." * 27 + "] 1/3",
+                "",
+            ],
+        )
+
+    def test_not_enabled_on_import(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "metrics.jsonl")
+            code = "import metrics; print(metrics.metrics_enabled())"
+            output = subprocess.run(
+                [sys.executable, "-c", code],
+                env={**os.environ, METRICS_ENV: path},
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            self.assertEqual(output, "False\n")
+            self.assertFalse(os.path.exists(path))
+
+    def test_solution_run_directly(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "metrics.jsonl")
+            subprocess.run(
+                [sys.executable, "solution.py"],
+                cwd="day-15",
+                env={**os.environ, METRICS_ENV: path, "PYTHONPATH": os.getcwd()},
+                capture_output=True,
+                check=True,
+            )
+            with open(path) as f:
+                events = [json.loads(line) for line in f]
+        self.assertEqual(
+            {(e["kind"], e["name"]) for e in events},
+            {
+                ("gauge", "day 15 candidate rows"),
+                ("progress", "day 15 rows"),
+                ("phase", "day 15 part 1"),
+                ("phase", "day 15 part 2"),
+            },
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import os
+import tempfile
+import unittest
+from functools import partial
+from unittest import mock
+
+from parse_cache import module_sources, parse_cache_key, store_cached
+from utils import CACHE_DIR_ENV, load_ints, parse_input
+
+# Lines parsed by parse_line, to tell cache hits from misses
+PARSED_LINES = []
+
+
+def parse_line(line):
+    PARSED_LINES.append(line)
+    return tuple(map(int, line.split()))
+
+
+class TestParseCache(unittest.TestCase):
+    def test_parse_input_cache(self):
+        PARSED_LINES.clear()
+        with tempfile.TemporaryDirectory() as tmp_dir, mock.patch.dict(
+            os.environ, {CACHE_DIR_ENV: tmp_dir}
+        ):
+            path = os.path.join(tmp_dir, "input")
+            with open(path, "w") as f:
+                f.write("1 2\n3 4\n")
+            expected = ((1, 2), (3, 4))
+            self.assertEqual(
+                parse_input(path, parse_fn=parse_line, cache=True), expected
+            )
+            self.assertEqual(
+                parse_input(path, parse_fn=parse_line, cache=True), expected
+            )
+            self.assertEqual(len(PARSED_LINES), 2)
+            # Another parse function or separator isn't served from the cache
+            self.assertEqual(parse_input(path, sep=" ", cache=True), ("1", "2\n3", "4"))
+            # Changing the content invalidates the cache
+            with open(path, "w") as f:
+                f.write("5 6\n")
+            self.assertEqual(
+                parse_input(path, parse_fn=parse_line, cache=True), ((5, 6),)
+            )
+            self.assertEqual(len(PARSED_LINES), 3)
+            # Parsed lines that can't be pickled are returned anyway
+            parsed = parse_input(path, parse_fn=lambda line: lambda: line, cache=True)
+            self.assertEqual(parsed[0](), "5 6")
+            # Lines are split the same way as without cache
+            with open(path, "wb") as f:
+                f.write(b"7 8\r\n9 10\r\n")
+            self.assertEqual(
+                parse_input(path, parse_fn=parse_line, cache=True), ((7, 8), (9, 10))
+            )
+
+    def test_parse_cache_key(self):
+        with tempfile.TemporaryDirectory() as tmp_dir, mock.patch.dict(
+            os.environ, {CACHE_DIR_ENV: tmp_dir}
+        ):
+            path = os.path.join(tmp_dir, "input")
+            with open(path, "w") as f:
+                f.write("1\n2\n")
+            # Lambdas and closures sharing a name aren't served each other's lines
+            parse_fns = [lambda line: int(line), lambda line: -int(line)]
+            self.assertEqual(
+                parse_input(path, parse_fn=parse_fns[0], cache=True), (1, 2)
+            )
+            self.assertEqual(
+                parse_input(path, parse_fn=parse_fns[1], cache=True), (-1, -2)
+            )
+            scale = lambda factor: lambda line: int(line) * factor  # noqa: E731
+            self.assertEqual(parse_input(path, parse_fn=scale(2), cache=True), (2, 4))
+            self.assertEqual(parse_input(path, parse_fn=scale(3), cache=True), (3, 6))
+        # Partial functions keys don't depend on their address
+        self.assertEqual(
+            parse_cache_key(b"1", "\n", partial(int, base=2)),
+            parse_cache_key(b"1", "\n", partial(int, base=2)),
+        )
+        self.assertNotEqual(
+            parse_cache_key(b"1", "\n", partial(int, base=2)),
+            parse_cache_key(b"1", "\n", partial(int, base=3)),
+        )
+
+    def test_module_sources(self):
+        # Modules imported from are hashed along with the parse function's one
+        self.assertEqual(
+            [os.path.basename(path) for path in module_sources(parse_line.__module__)],
+            ["parse_cache.py", "test_parse_cache.py", "utils.py"],
+        )
+        self.assertEqual(
+            [os.path.basename(path) for path in module_sources(int.__module__)],
+            ["parse_cache.py"],
+        )
+
+    def test_store_cached_failure(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with mock.patch("os.replace", side_effect=OSError):
+                self.assertFalse(store_cached(os.path.join(tmp_dir, "value"), 1))
+            self.assertEqual(os.listdir(tmp_dir), [])
+
+    def test_load_ints_cache(self):
+        with tempfile.TemporaryDirectory() as tmp_dir, mock.patch.dict(
+            os.environ, {CACHE_DIR_ENV: tmp_dir}
+        ):
+            for _ in range(2):
+                values, offsets = load_ints("day-15/test_input", cache=True)
+                expected_values, expected_offsets = load_ints("day-15/test_input")
+                self.assertEqual(values.tolist(), expected_values.tolist())
+                self.assertEqual(offsets.tolist(), expected_offsets.tolist())
+                self.assertTrue(values.flags.writeable)
+
+
+if __name__ == "__main__":
+    unittest.main()
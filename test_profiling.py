@@ -0,0 +1,42 @@
+import json
+import os
+import tempfile
+import unittest
+
+from profiling import profile_phase
+from runner import run_part
+
+
+class TestProfiling(unittest.TestCase):
+    def test_profile_phase(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with profile_phase(tmp_dir, "squares"):
+                squares = [n * n for n in range(100_000)]
+            with open(os.path.join(tmp_dir, "squares.json")) as f:
+                report = json.load(f)
+            self.assertTrue(os.path.exists(os.path.join(tmp_dir, "squares.pstats")))
+        self.assertEqual(report["name"], "squares")
+        self.assertGreater(report["tracemalloc_peak"], 100_000 * 8)
+        # The list is still allocated at the end of the phase
+        self.assertIn("test_profiling.py", report["top_allocations"][0]["location"])
+        self.assertEqual(len(squares), 100_000)
+
+    def test_run_part(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            result = run_part(14, 2, "day-14/test_input", profile_dir=tmp_dir)
+            self.assertEqual(result.answer, 93)
+            self.assertEqual(
+                sorted(os.listdir(tmp_dir)),
+                [
+                    f"day-14.part-2.{phase}.{extension}"
+                    for phase in ("parse", "solve")
+                    for extension in ("json", "pstats")
+                ],
+            )
+            with open(os.path.join(tmp_dir, "day-14.part-2.solve.json")) as f:
+                functions = [f["function"] for f in json.load(f)["top_functions"]]
+            self.assertTrue(any("drop_sand" in function for function in functions))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from metrics import METRICS_ENV
+from runner import discover_days, run_days, run_part
+from utils import CACHE_DIR_ENV
+
+
+class TestRunner(unittest.TestCase):
+    def test_discover_days(self):
+        self.assertEqual(discover_days()[:2], (1, 2))
+
+    def test_run_part(self):
+        result = run_part(1, 1, input_path="day-01/test_input")
+        self.assertEqual((result.day, result.part, result.answer), (1, 1, 24000))
+        # Parts parsing the input differently use their own parser
+        self.assertEqual(run_part(2, 2, input_path="day-02/test_input").answer, 12)
+
+    def test_run_part_cache(self):
+        with tempfile.TemporaryDirectory() as tmp_dir, mock.patch.dict(
+            os.environ, {CACHE_DIR_ENV: tmp_dir}
+        ), mock.patch("runner._answer_cache", None):
+            results = [
+                run_part(15, 1, "day-15/test_input", cache=True, row_idx=10)
+                for _ in range(2)
+            ]
+            self.assertEqual([r.answer for r in results], [26, 26])
+            self.assertEqual([r.cached for r in results], [False, True])
+            # Other solver arguments give other answers
+            result = run_part(15, 1, "day-15/test_input", cache=True, row_idx=11)
+            self.assertEqual((result.answer, result.cached), (27, False))
+
+    def test_run_days(self):
+        results = run_days((1, 6), workers=2)
+        self.assertEqual(
+            tuple((r.day, r.part) for r in results), ((1, 1), (1, 2), (6, 1), (6, 2))
+        )
+        self.assertEqual(results[0].answer, 67658)
+
+    def test_run_days_metrics(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "metrics.jsonl")
+            with mock.patch.dict(os.environ, {METRICS_ENV: path}):
+                run_days((6,), workers=1)
+            with open(path) as f:
+                phases = [json.loads(line)["name"] for line in f]
+        self.assertEqual(
+            sorted(phases),
+            [
+                f"day 06 part {part} {phase}"
+                for part in (1, 2)
+                for phase in ("parse", "solve")
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
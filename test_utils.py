@@ -0,0 +1,253 @@
+import os
+import tempfile
+import unittest
+
+from typing import NamedTuple
+
+import numpy as np
+
+from utils import (
+    NEIGHBORS_4,
+    NEIGHBORS_8,
+    UNREACHABLE,
+    Bitmap,
+    Grid,
+    IntervalSet,
+    all_pairs_distances,
+    batchify,
+    bfs_distance,
+    bfs_distances,
+    bfs_multi_source_distance,
+    bfs_shortest_path,
+    chunk_ranges,
+    in_bounds,
+    iter_bits,
+    iter_input,
+    load_ints,
+    mask_from_chars,
+    mask_from_indices,
+    pack,
+    packed_offset,
+    parse_input,
+    parse_ints,
+    parse_ints_array,
+    popcount,
+    reshape,
+    reverse,
+    sliding_window,
+    strided_windows,
+    transpose,
+    unpack,
+    window_ranges,
+)
+
+Node = NamedTuple("Node", [("neighbors", set[str])])
+# A -> B -> C -> D and A -> E -> D, F is unreachable
+GRAPH = {
+    "A": Node({"B", "E"}),
+    "B": Node({"C"}),
+    "C": Node({"D"}),
+    "D": Node(set()),
+    "E": Node({"D"}),
+    "F": Node({"A"}),
+}
+
+
+class TestInput(unittest.TestCase):
+    def test_iter_input(self):
+        for path, sep in (
+            ("day-01/test_input", "\n\n"),
+            ("day-07/test_input", "\n$ "),
+            ("day-08/test_input", "\n"),
+        ):
+            with self.subTest(path=path):
+                self.assertEqual(
+                    tuple(iter_input(path, sep=sep)), parse_input(path, sep=sep)
+                )
+
+    def test_chunk_ranges(self):
+        path = "day-01/test_input"
+        with open(path, "rb") as f:
+            content = f.read()
+        ranges = chunk_ranges(path, sep="\n\n", chunk_size=10)
+        self.assertEqual(len(ranges), 4)
+        self.assertEqual(b"".join(content[start:end] for start, end in ranges), content)
+        self.assertTrue(all(content[:end].endswith(b"\n\n") for _, end in ranges[:-1]))
+        self.assertEqual(chunk_ranges(path, sep="\n\n"), [(0, len(content))])
+
+    def test_iter_input_parse_fn(self):
+        self.assertEqual(
+            tuple(iter_input("day-01/test_input", sep="\n\n", parse_fn=len)),
+            parse_input("day-01/test_input", sep="\n\n", parse_fn=len),
+        )
+
+    def test_iter_input_empty_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "input")
+            open(path, "w").close()
+            self.assertEqual(tuple(iter_input(path)), ())
+
+    def test_parse_ints_array(self):
+        values, offsets = parse_ints_array("x=-12, y=5\n\nno ints\n7-3 -4\n")
+        self.assertEqual(values.tolist(), [-12, 5, 7, -3, -4])
+        self.assertEqual(offsets.tolist(), [0, 2, 2, 2, 5])
+        self.assertEqual(parse_ints_array("9" * 18)[0].tolist(), [10**18 - 1])
+        # Longer integers are parsed with int() rather than overflowing
+        values, offsets = parse_ints_array("-" + "1" * 19 + " 2\n3")
+        self.assertEqual(values.tolist(), [-int("1" * 19), 2, 3])
+        self.assertEqual(offsets.tolist(), [0, 2, 3])
+        values, offsets = load_ints("day-15/test_input")
+        lines = parse_input("day-15/test_input", parse_fn=parse_ints)
+        self.assertEqual(
+            tuple(tuple(values[start:end]) for start, end in zip(offsets, offsets[1:])),
+            lines,
+        )
+
+
+class TestIteration(unittest.TestCase):
+    def test_batchify(self):
+        self.assertEqual(tuple(batchify(iter(range(5)), 2)), ([0, 1], [2, 3], [4]))
+        self.assertEqual(tuple(batchify((0, 1, 2), 2)), ((0, 1), (2,)))
+        self.assertEqual(tuple(batchify("abc", 2)), ("ab", "c"))
+        batches = tuple(batchify(b"abcde", 2))
+        self.assertIsInstance(batches[0], memoryview)
+        self.assertEqual(tuple(bytes(b) for b in batches), (b"ab", b"cd", b"e"))
+
+    def test_reshape(self):
+        self.assertEqual(reshape((1, 2, 3, 4), width=2).tolist(), [[1, 2], [3, 4]])
+        values = np.arange(6)
+        self.assertTrue(np.shares_memory(reshape(values, width=3), values))
+
+    def test_sliding_window(self):
+        self.assertEqual(
+            tuple(sliding_window(iter(range(4)), size=2)), ((0, 1), (1, 2), (2, 3))
+        )
+        with self.assertRaises(ValueError):
+            tuple(sliding_window(range(2), size=3))
+        # Bytes-like objects and strs are sliced rather than copied element-wise
+        windows = tuple(sliding_window(b"abcd", size=3))
+        self.assertIsInstance(windows[0], memoryview)
+        self.assertEqual(tuple(bytes(w) for w in windows), (b"abc", b"bcd"))
+        self.assertEqual(tuple(sliding_window("abcd", size=3)), ("abc", "bcd"))
+        with self.assertRaises(ValueError):
+            tuple(sliding_window(b"ab", size=3))
+
+    def test_sequence_windows(self):
+        self.assertEqual(
+            tuple("abcd"[w.start : w.stop] for w in window_ranges("abcd", size=3)),
+            ("abc", "bcd"),
+        )
+        self.assertEqual(
+            strided_windows(range(4), size=3).tolist(), [[0, 1, 2], [1, 2, 3]]
+        )
+
+
+class TestPackedPoints(unittest.TestCase):
+    def test_pack(self):
+        for point in ((0, 0), (3, -7), (-2_000_000, 4_000_000)):
+            self.assertEqual(unpack(pack(*point)), point)
+        self.assertEqual(pack(3, 0) + packed_offset(-5, -1), pack(-2, -1))
+
+    def test_neighbors(self):
+        origin = pack(0, 0)
+        self.assertEqual(
+            {unpack(origin + offset) for offset in NEIGHBORS_4},
+            {(1, 0), (-1, 0), (0, 1), (0, -1)},
+        )
+        self.assertEqual(len({origin + offset for offset in NEIGHBORS_8}), 8)
+        self.assertTrue(in_bounds(pack(1, 2), 2, 3))
+        self.assertFalse(in_bounds(pack(2, 2), 2, 3))
+        self.assertFalse(in_bounds(pack(1, -1), 2, 3))
+
+
+class TestGrid(unittest.TestCase):
+    def test_views(self):
+        grid = Grid.from_lines(
+            ("123", "456"), parse_fn=lambda line: tuple(map(int, line))
+        )
+        self.assertEqual(grid.transpose().to_tuples(), transpose(grid.to_tuples()))
+        self.assertEqual(grid.flip().to_tuples(), reverse(grid.to_tuples()))
+        self.assertTrue(np.shares_memory(grid.transpose().flip().array, grid.array))
+
+    def test_overlay(self):
+        grid = Grid.from_lines(("ab", "cd"))
+        self.assertEqual(
+            Grid.overlay(grid, grid.flip(), reducer=np.maximum).to_tuples(),
+            ((98, 98), (100, 100)),
+        )
+
+
+class TestBitsets(unittest.TestCase):
+    def test_masks(self):
+        mask = mask_from_chars("abcA")
+        self.assertEqual(mask, mask_from_indices((0, 1, 2, 26)))
+        self.assertEqual(popcount(mask), 4)
+        self.assertEqual(tuple(iter_bits(mask & mask_from_chars(b"cAZ"))), (2, 26))
+
+    def test_bitmap(self):
+        bitmap = Bitmap(100)
+        for idx in (0, 7, 8, 99):
+            bitmap.add(idx)
+        bitmap.discard(7)
+        self.assertEqual(
+            (8 in bitmap, 7 in bitmap, 100 in bitmap), (True, False, False)
+        )
+        self.assertEqual(len(bitmap), 3)
+        self.assertEqual(bitmap.to_array().tolist(), [0, 8, 99])
+        for idx in (-1, 100):
+            with self.subTest(idx=idx), self.assertRaises(IndexError):
+                bitmap.add(idx)
+            with self.subTest(idx=idx), self.assertRaises(IndexError):
+                bitmap.discard(idx)
+        self.assertEqual(len(bitmap), 3)
+
+
+class TestIntervalSet(unittest.TestCase):
+    def test_add(self):
+        intervals = IntervalSet([(10, 20), (30, 40), (0, 2)])
+        self.assertEqual(tuple(intervals), ((0, 2), (10, 20), (30, 40)))
+        self.assertEqual(intervals.covered_length, 25)
+        intervals.add(3, 9)  # adjacent intervals are merged too
+        intervals.add(15, 35)
+        self.assertEqual(tuple(intervals), ((0, 40),))
+        self.assertEqual(intervals.covered_length, 41)
+        union = intervals | IntervalSet([(50, 51)])
+        self.assertEqual((intervals.covered_length, union.covered_length), (41, 43))
+
+    def test_membership_and_gaps(self):
+        intervals = IntervalSet([(0, 2), (10, 20)]) | IntervalSet([(30, 40)])
+        self.assertEqual(
+            (2 in intervals, 3 in intervals, -1 in intervals), (True, False, False)
+        )
+        self.assertEqual(
+            tuple(intervals.gaps(-5, 50)), ((-5, -1), (3, 9), (21, 29), (41, 50))
+        )
+        self.assertEqual(tuple(intervals.gaps(12, 35)), ((21, 29),))
+        self.assertEqual(tuple(intervals.gaps(12, 18)), ())
+
+
+class TestGraphs(unittest.TestCase):
+    def test_bfs_shortest_path(self):
+        self.assertEqual(bfs_shortest_path(GRAPH, "A", "D"), ["A", "E", "D"])
+        self.assertEqual(bfs_shortest_path(GRAPH, "A", "A"), ["A"])
+        self.assertEqual(bfs_shortest_path(GRAPH, "A", "F"), [])
+
+    def test_bfs_distance(self):
+        self.assertEqual(bfs_distance(GRAPH, "A", "D"), 2)
+        self.assertIsNone(bfs_distance(GRAPH, "D", "A"))
+        self.assertEqual(bfs_distances(GRAPH, "B"), {"B": 0, "C": 1, "D": 2})
+
+    def test_bfs_multi_source_distance(self):
+        self.assertEqual(bfs_multi_source_distance(GRAPH, ("A", "C"), "D"), 1)
+        self.assertEqual(bfs_multi_source_distance(GRAPH, ("F", "B"), "A"), 1)
+
+    def test_all_pairs_distances(self):
+        distances, index = all_pairs_distances(GRAPH)
+        self.assertEqual(distances[index["A"]][index["D"]], 2)
+        self.assertEqual(distances[index["F"]][index["C"]], 3)
+        self.assertEqual(distances[index["D"]][index["A"]], UNREACHABLE)
+        self.assertEqual(all_pairs_distances(dict(GRAPH)), (distances, index))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import mmap
+import os
 import re
-from itertools import chain
+import string
+from bisect import bisect_left, bisect_right
+from collections import deque
+from functools import lru_cache
+from itertools import chain, islice
 from typing import (
     Any,
     Callable,
@@ -9,28 +15,204 @@ from typing import (
     Generator,
     Hashable,
     Iterable,
+    Iterator,
     Protocol,
     Sequence,
+    Sized,
+    TYPE_CHECKING,
     TypeVar,
 )
 
+if TYPE_CHECKING:
+    import numpy as np
+
 T = TypeVar("T")
 INT_REGEX = re.compile(r"(-*\d+)")
+# Every integer of up to 18 digits fits in an int64 (whose max is ~9.2 * 10**18)
+MAX_INT64_DIGITS = 18
+# Caches are stored in the AOC_CACHE_DIR directory (.cache next to this file by
+# default)
+CACHE_DIR_ENV = "AOC_CACHE_DIR"
 
 
 def parse_input(
-    path: str = "./input", sep: str = "\n", parse_fn: Callable[[str], T] = str
+    path: str = "./input",
+    sep: str = "\n",
+    parse_fn: Callable[[str], T] = str,
+    cache: bool | None = None,
 ) -> tuple[T, ...]:
-    """Returns parsed lines from an input file."""
+    """
+    Returns parsed lines from an input file.
+
+    When cache is True (or None and the AOC_PARSE_CACHE environment variable is
+    set), parsed lines are stored on disk and loaded from there by the next calls
+    with the same input content, separator and parse function. Parsed lines that
+    cannot be pickled (e.g. holding lambdas) are simply not cached.
+    """
+    from parse_cache import cached_parse, is_parse_cache_enabled
+
+    if is_parse_cache_enabled(cache):
+        return cached_parse(
+            path,
+            lambda content: tuple(
+                parse_fn(line) for line in decode_text(content).rstrip().split(sep)
+            ),
+            sep,
+            parse_fn,
+        )
     with open(path, "r") as f:
         lines = f.read().rstrip().split(sep)
         return tuple(parse_fn(line) for line in lines)
 
 
+def iter_input(
+    path: str = "./input", sep: str = "\n", parse_fn: Callable[[str], T] = str
+) -> Generator[T, None, None]:
+    """
+    Lazily yields parsed records from an input file.
+
+    It's the streaming counterpart of parse_input: the file is memory-mapped and
+    records are decoded and parsed one at a time, so only the current record is
+    held in memory whatever the file size.
+    """
+    with open(path, "rb") as f:
+        if not os.fstat(f.fileno()).st_size:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Mimic parse_input's rstrip() without copying the whole content
+            end = len(mm)
+            while end and mm[end - 1 : end].isspace():
+                end -= 1
+            if not end:
+                return
+            separator, cursor = sep.encode(), 0
+            while True:
+                next_cursor = mm.find(separator, cursor, end)
+                if next_cursor == -1:
+                    yield parse_fn(mm[cursor:end].decode())
+                    return
+                yield parse_fn(mm[cursor:next_cursor].decode())
+                cursor = next_cursor + len(separator)
+
+
+def chunk_ranges(
+    path: str = "./input", sep: str = "\n", chunk_size: int = 1 << 24
+) -> list[tuple[int, int]]:
+    """
+    Splits an input file into (start, end) byte ranges of about chunk_size bytes,
+    each one ending right after a separator (or at the end of the file) so that
+    no record straddles two chunks, e.g. to process chunks in parallel.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if not size:
+            return []
+        ranges, start, separator = [], 0, sep.encode()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            while start < size:
+                sep_idx = mm.find(separator, start + chunk_size)
+                end = size if sep_idx == -1 else sep_idx + len(separator)
+                ranges.append((start, end))
+                start = end
+    return ranges
+
+
 def parse_ints(text: str) -> tuple[int, ...]:
     return tuple(int(m) for m in INT_REGEX.findall(text))
 
 
+def parse_ints_array(data: str | bytes | memoryview) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized parse_ints over a whole text buffer.
+    Returns all the integers in an int64 array, along with the offset of the
+    first integer of each line (plus a final offset equal to the integers count),
+    so that values[offsets[i] : offsets[i + 1]] are the integers of line i.
+    Integers of more than MAX_INT64_DIGITS digits could overflow, values are then
+    parsed with int() into an object array instead.
+    E.g.:
+    >>> parse_ints_array("1,-2\\n30")
+    (array([ 1, -2, 30]), array([0, 2, 3]))
+    """
+    import numpy as np
+
+    if isinstance(data, str):
+        data = data.encode()
+    chars = np.frombuffer(data, dtype=np.uint8)
+    # Mimic parse_input's rstrip() without copying the whole content
+    end = len(chars)
+    while end and chr(chars[end - 1]).isspace():
+        end -= 1
+    chars = chars[:end]
+
+    digits = chars - np.uint8(ord("0"))
+    is_digit = digits < 10  # non-digits wrap around as uint8
+    edges = np.flatnonzero(np.diff(is_digit, prepend=False, append=False))
+    starts, ends = edges[::2], edges[1::2]
+    lengths = ends - starts
+    if lengths.max(initial=0) > MAX_INT64_DIGITS:
+        # Python ints don't overflow, at the cost of parsing numbers one by one
+        text = chars.tobytes()
+        values = np.array(
+            [int(text[start:end]) for start, end in zip(starts, ends)], dtype=object
+        )
+    else:
+        # Numbers are built digit by digit from their end, for all numbers at once
+        # (digits past the start of shorter numbers are masked out).
+        values = np.zeros(len(starts), dtype=np.int64)
+        for position in range(lengths.max(initial=0)):
+            position_digits = digits[np.maximum(ends - 1 - position, 0)]
+            values += np.where(lengths > position, position_digits, 0) * np.int64(
+                10**position
+            )
+    is_negative = (starts > 0) & (chars[starts - 1] == ord("-"))
+    values[is_negative] *= -1
+
+    lines_starts = np.concatenate(([0], np.flatnonzero(chars == ord("\n")) + 1))
+    offsets = np.append(np.searchsorted(starts, lines_starts), len(values))
+    return values, offsets
+
+
+def load_ints(
+    path: str = "./input", cache: bool | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    parse_ints_array over the whole content of an input file. Arrays are cached
+    in the same way as parse_input's parsed lines.
+    """
+    import numpy as np
+
+    from parse_cache import cached_parse, is_parse_cache_enabled
+
+    if is_parse_cache_enabled(cache):
+        return cached_parse(path, parse_ints_array, "", parse_ints_array)
+    return parse_ints_array(np.fromfile(path, dtype=np.uint8))
+
+
+def pretty_print(*objects: Any, **kwargs: Any) -> None:
+    """
+    Prints with rich, imported on first use only since importing it can take
+    longer than running a solution. Falls back to the built-in print when rich
+    isn't installed.
+    """
+    try:
+        from rich import print as print_fn
+    except ImportError:
+        print_fn = print
+    print_fn(*objects, **kwargs)
+
+
+def decode_text(content: bytes) -> str:
+    """Decodes file content the way text mode does, with universal newlines."""
+    return content.decode().replace("\r\n", "\n").replace("\r", "\n")
+
+
+def cache_dir(name: str) -> str:
+    root_dir = os.environ.get(CACHE_DIR_ENV) or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), ".cache"
+    )
+    return os.path.join(root_dir, name)
+
+
 def assert_never(value):
     """
     Raises an AssertionError for the provided value.
@@ -46,27 +228,44 @@ def assert_never(value):
 ###################
 
 
-def batchify(iterable: Iterable[T], batch_size: int) -> Generator[list[T], None, None]:
+def batchify(
+    iterable: Iterable[T], batch_size: int
+) -> Generator[Sequence[T], None, None]:
     """
     Yields batches of batch_size from the iterable. The last batch will be
     smaller than batch_size if the iterable length isn't a multiple of batch_size.
+    Sequences are sliced rather than copied element by element, so batches have
+    the type of the sequence slices (tuples for tuples, lists for lists, strs for
+    strs and zero-copy memoryviews for bytes-like objects), and other iterables
+    yield lists. Callers needing tuples (e.g. hashable points) must either pass
+    tuples or convert the batches.
     E.g.:
     >>> tuple(batchify(iterable=[1, 2, 3], batch_size=2))
-    ([1,2], [3])
-    """
-    iterator, cursor = iter(iterable), 0
-    batch = []
-    while True:
-        try:
-            batch.append(next(iterator))
-            cursor += 1
-        except StopIteration:
-            if batch:
-                yield batch
-            return
-        if cursor % batch_size == 0:
-            yield batch
-            batch = []
+    ([1, 2], [3])
+    """
+    if isinstance(iterable, (bytes, bytearray, memoryview)):
+        iterable = memoryview(iterable)
+    if isinstance(iterable, (Sequence, memoryview)):
+        for start in range(0, len(iterable), batch_size):
+            yield iterable[start : start + batch_size]
+        return
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
+def reshape(seq: Sequence[int] | np.ndarray, width: int) -> np.ndarray:
+    """
+    Returns numeric values as a (n, width) NumPy array, a view when the values
+    already are an array.
+    E.g.:
+    >>> reshape((1, 2, 3, 4), width=2)
+    array([[1, 2],
+           [3, 4]])
+    """
+    import numpy as np
+
+    return np.asarray(seq).reshape(-1, width)
 
 
 def count_if(iterable: Iterable, predicate: Callable[[Any], bool] = bool) -> int:
@@ -91,16 +290,59 @@ flatten = chain.from_iterable
 
 def sliding_window(
     iterable: Iterable[T], size: int = 1
-) -> Generator[tuple[T, ...], None, None]:
+) -> Generator[Sequence[T], None, None]:
+    """
+    Yields each window of the iterable. Bytes-like objects yield zero-copy
+    memoryviews and strs yield slices (copied by a single C-level memcpy), other
+    iterables yield tuples: advancing the window is O(1) but each tuple is a
+    copy, so steps are O(size). window_ranges and strided_windows avoid the
+    copies for large windows over other sequences.
+    E.g.:
+    >>> [bytes(window) for window in sliding_window(b"abc", size=2)]
+    [b'ab', b'bc']
+    """
+    if isinstance(iterable, (bytes, bytearray, memoryview, str)):
+        if size > len(iterable):
+            raise ValueError("size must be less than or equal to iterable length")
+        if not isinstance(iterable, str):
+            iterable = memoryview(iterable)
+        for start in range(len(iterable) - size + 1):
+            yield iterable[start : start + size]
+        return
     iterator = iter(iterable)
-    try:
-        window = tuple(next(iterator) for _ in range(size))
-    except RuntimeError:
+    window = deque(islice(iterator, size), maxlen=size)
+    if len(window) < size:
         raise ValueError("size must be less than or equal to iterable length")
-    yield window
+    yield tuple(window)
     for next_element in iterator:
-        window = window[1:] + (next_element,)
-        yield window
+        window.append(next_element)
+        yield tuple(window)
+
+
+def window_ranges(seq: Sized, size: int = 1) -> Generator[range, None, None]:
+    """
+    Yields the indices range of each window of the sequence instead of the
+    window itself, so that nothing is copied (e.g. strings can then be
+    scanned through their indices).
+    """
+    if size > len(seq):
+        raise ValueError("size must be less than or equal to sequence length")
+    for start in range(len(seq) - size + 1):
+        yield range(start, start + size)
+
+
+def strided_windows(seq: Sequence[T], size: int = 1) -> np.ndarray:
+    """
+    Returns all the windows at once as a read-only 2D NumPy view of shape
+    (len(seq) - size + 1, size), to be consumed by vectorized operations.
+    """
+    import numpy as np
+
+    if isinstance(seq, (bytes, bytearray, memoryview)):
+        array = np.frombuffer(seq, dtype=np.uint8)
+    else:
+        array = np.asarray(seq)
+    return np.lib.stride_tricks.sliding_window_view(array, size)
 
 
 ###########################
@@ -147,6 +389,304 @@ def Y(point: Point) -> int:
     return point[1]
 
 
+# Points can also be packed in a single int, which is cheaper to hash, compare
+# and store than a tuple. Both coordinates are biased to be stored as unsigned
+# 32 bits integers, so that adding a packed offset to a packed point gives the
+# packed translated point.
+PackedPoint = int
+PACK_SHIFT = 32
+PACK_MASK = (1 << PACK_SHIFT) - 1
+PACK_BIAS = 1 << (PACK_SHIFT - 1)
+
+
+def pack(x: int, y: int) -> PackedPoint:
+    return ((x + PACK_BIAS) << PACK_SHIFT) | (y + PACK_BIAS)
+
+
+def unpack(point: PackedPoint) -> Point:
+    return (point >> PACK_SHIFT) - PACK_BIAS, (point & PACK_MASK) - PACK_BIAS
+
+
+def packed_x(point: PackedPoint) -> int:
+    return (point >> PACK_SHIFT) - PACK_BIAS
+
+
+def packed_y(point: PackedPoint) -> int:
+    return (point & PACK_MASK) - PACK_BIAS
+
+
+def packed_offset(dx: int, dy: int) -> int:
+    """Value to add to a packed point to translate it by (dx, dy)."""
+    return (dx << PACK_SHIFT) + dy
+
+
+NEIGHBORS_4 = tuple(
+    packed_offset(dx, dy) for dx, dy in ((1, 0), (0, 1), (-1, 0), (0, -1))
+)
+NEIGHBORS_8 = tuple(
+    packed_offset(dx, dy)
+    for dx in (-1, 0, 1)
+    for dy in (-1, 0, 1)
+    if (dx, dy) != (0, 0)
+)
+
+
+def in_bounds(point: PackedPoint, x_size: int, y_size: int) -> bool:
+    """Whether the point lies in the [0, x_size) x [0, y_size) area."""
+    return 0 <= packed_x(point) < x_size and 0 <= packed_y(point) < y_size
+
+
+class Grid:
+    """
+    2D grid backed by a NumPy array, indexed as grid[x, y] (x being the line).
+
+    Unlike the tuple-based array functions, transposing and flipping a grid
+    return views over the same memory and overlaying grids is a single
+    vectorized operation.
+    """
+
+    def __init__(self, values: Grid | Sequence[Sequence[T]] | np.ndarray):
+        import numpy as np
+
+        self.array = values.array if isinstance(values, Grid) else np.asarray(values)
+
+    @classmethod
+    def from_lines(
+        cls,
+        lines: Sequence[str],
+        parse_fn: Callable[[str], Sequence[T]] | None = None,
+    ) -> Grid:
+        """
+        Builds a grid from parse_input lines. Without parse_fn, the grid holds the
+        character codes (e.g. grid.array - ord("0") for digits).
+        """
+        import numpy as np
+
+        if parse_fn is not None:
+            return cls([parse_fn(line) for line in lines])
+        codes = np.frombuffer("".join(lines).encode(), dtype=np.uint8)
+        return cls(codes.reshape(len(lines), -1))
+
+    @property
+    def height(self) -> int:
+        return self.array.shape[0]
+
+    @property
+    def width(self) -> int:
+        return self.array.shape[1]
+
+    def __getitem__(self, key):
+        return self.array[key]
+
+    def __iter__(self):
+        return iter(self.array)
+
+    def __len__(self) -> int:
+        return self.height
+
+    def transpose(self) -> Grid:
+        return type(self)(self.array.T)
+
+    def flip(self) -> Grid:
+        """Reverses each line of the grid (like reverse)."""
+        return type(self)(self.array[:, ::-1])
+
+    @classmethod
+    def overlay(cls, *grids: Grid, reducer: np.ufunc) -> Grid:
+        """
+        Merges grids of identical shape in a single one, reducing values at the
+        same position with the reducer ufunc (e.g. np.logical_or, np.add).
+        """
+        return cls(reducer.reduce([grid.array for grid in grids]))
+
+    def to_tuples(self) -> tuple[tuple[T, ...], ...]:
+        return tuple(tuple(line) for line in self.array.tolist())
+
+
+###########
+# Bitsets #
+###########
+
+# Small sets (characters, valves...) can be stored as int masks, bit i being set
+# when the element of index i is in the set. Masks are cheap to combine (&, |, ^)
+# and hashable, which makes them good memoization keys.
+
+
+def bit_table(alphabet: str) -> tuple[int, ...]:
+    """
+    Returns a 256 entries table mapping each byte value to its bit in a mask
+    (0 for bytes not in the alphabet).
+    """
+    table = [0] * 256
+    for idx, char in enumerate(alphabet):
+        table[ord(char)] = 1 << idx
+    return tuple(table)
+
+
+# "a" is bit 0, ..., "z" is bit 25, "A" is bit 26, ..., "Z" is bit 51
+LETTERS_BITS = bit_table(string.ascii_letters)
+
+
+def mask_from_chars(chars: str | bytes, table: Sequence[int] = LETTERS_BITS) -> int:
+    if isinstance(chars, str):
+        chars = chars.encode()
+    mask = 0
+    for byte in chars:
+        mask |= table[byte]
+    return mask
+
+
+def mask_from_indices(indices: Iterable[int]) -> int:
+    mask = 0
+    for idx in indices:
+        mask |= 1 << idx
+    return mask
+
+
+def popcount(mask: int) -> int:
+    return mask.bit_count()
+
+
+def iter_bits(mask: int) -> Generator[int, None, None]:
+    """Yields the indices of the bits set in the mask, in increasing order."""
+    while mask:
+        lowest_bit = mask & -mask
+        yield lowest_bit.bit_length() - 1
+        mask ^= lowest_bit
+
+
+class Bitmap:
+    """
+    Set of integers in [0, size) stored as a packed array of bits, for index
+    spaces too large for int masks (e.g. the points of a large grid).
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.bits = bytearray((size + 7) // 8)
+
+    def add(self, idx: int) -> None:
+        self._check_index(idx)
+        self.bits[idx >> 3] |= 1 << (idx & 7)
+
+    def discard(self, idx: int) -> None:
+        self._check_index(idx)
+        self.bits[idx >> 3] &= ~(1 << (idx & 7))
+
+    def _check_index(self, idx: int) -> None:
+        # Negative indices would wrap around the bytearray, and indices past the
+        # size would set the padding bits of the last byte
+        if not 0 <= idx < self.size:
+            raise IndexError(f"Bitmap index out of range: {idx}")
+
+    def __contains__(self, idx: int) -> bool:
+        return 0 <= idx < self.size and bool(self.bits[idx >> 3] & (1 << (idx & 7)))
+
+    def __len__(self) -> int:
+        return int.from_bytes(self.bits, "little").bit_count()
+
+    def to_array(self) -> np.ndarray:
+        """Indices of the set bits, as a NumPy array."""
+        import numpy as np
+
+        bits = np.unpackbits(
+            np.frombuffer(self.bits, dtype=np.uint8), bitorder="little"
+        )
+        return np.flatnonzero(bits[: self.size])
+
+
+#############
+# Intervals #
+#############
+
+Interval = tuple[int, int]  # bounds are inclusive
+
+
+class IntervalSet:
+    """
+    Set of integers stored as sorted, disjoint and non-adjacent intervals:
+    overlapping or adjacent intervals are merged on insertion, so memory and
+    operations costs depend on the number of intervals, not on their length.
+    Lookups are O(log n) with n intervals and the covered length is kept up to
+    date by insertions, which bisect the starts and ends lists. Insertions are
+    O(n) in the worst case since the following intervals are shifted in the lists
+    (a memory move, cheap for the sizes of the puzzles).
+    E.g.:
+    >>> intervals = IntervalSet([(1, 3), (5, 8), (4, 4)])
+    >>> tuple(intervals), intervals.covered_length, 7 in intervals
+    (((1, 8),), 8, True)
+    """
+
+    def __init__(self, intervals: Iterable[Interval] = ()):
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+        self._covered_length = 0
+        for start, end in intervals:
+            self.add(start, end)
+
+    def add(self, start: int, end: int) -> None:
+        """
+        Adds the [start, end] interval, merging it with the ones it touches, in
+        O(n) because of the list shifts.
+        """
+        if start > end:
+            return
+        first_idx = bisect_left(self._ends, start - 1)
+        last_idx = bisect_right(self._starts, end + 1)
+        if first_idx < last_idx:
+            start = min(start, self._starts[first_idx])
+            end = max(end, self._ends[last_idx - 1])
+            # Each interval is merged at most once, so this is amortized O(1)
+            for idx in range(first_idx, last_idx):
+                self._covered_length -= self._ends[idx] - self._starts[idx] + 1
+        self._covered_length += end - start + 1
+        self._starts[first_idx:last_idx] = (start,)
+        self._ends[first_idx:last_idx] = (end,)
+
+    def union(self, *others: IntervalSet) -> IntervalSet:
+        result = IntervalSet()
+        result._starts, result._ends = self._starts.copy(), self._ends.copy()
+        result._covered_length = self._covered_length
+        for other in others:
+            for start, end in other:
+                result.add(start, end)
+        return result
+
+    __or__ = union
+
+    @property
+    def covered_length(self) -> int:
+        """Number of integers in the set."""
+        return self._covered_length
+
+    def gaps(self, start: int, end: int) -> Generator[Interval, None, None]:
+        """Yields the intervals of [start, end] that aren't in the set."""
+        cursor = start
+        for idx in range(max(bisect_right(self._starts, start) - 1, 0), len(self)):
+            interval_start, interval_end = self._starts[idx], self._ends[idx]
+            if interval_start > end:
+                break
+            if interval_start > cursor:
+                yield cursor, interval_start - 1
+            cursor = max(cursor, interval_end + 1)
+        if cursor <= end:
+            yield cursor, end
+
+    def __contains__(self, value: int) -> bool:
+        idx = bisect_right(self._starts, value) - 1
+        return idx >= 0 and value <= self._ends[idx]
+
+    def __iter__(self) -> Iterator[Interval]:
+        return zip(self._starts, self._ends)
+
+    def __len__(self) -> int:
+        """Number of disjoint intervals (see covered_length for integers count)."""
+        return len(self._starts)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)})"
+
+
 ############################
 # Graphs related functions #
 ############################
@@ -159,36 +699,109 @@ class Node(Protocol):
 Graph = dict[Hashable, Node]
 
 
-def bfs_shortest_path(graph: Graph, start: Hashable, end: Hashable) -> list[Hashable]:
+def _bfs(
+    graph: Graph, starts: Iterable[Hashable], end: Hashable | None = None
+) -> tuple[dict[Hashable, Hashable | None], dict[Hashable, int]]:
     """
-    Finds the shortest path between start and end nodes in the graph using a
-    breadth-first search algorithm (https://www.wikiwand.com/en/Breadth-first_search).
+    Breadth-first search (https://www.wikiwand.com/en/Breadth-first_search) from
+    one or several start nodes, stopping as soon as the end node is reached (if
+    provided).
+    Returns the parent of each visited node (None for start nodes) to rebuild
+    paths, and the distance of each visited node to its closest start node.
     """
-    if start == end:
-        return [start]
-    queue = [[start, []]]
-    visited = set()
+    parents: dict[Hashable, Hashable | None] = {}
+    distances: dict[Hashable, int] = {}
+    for start in starts:
+        parents[start], distances[start] = None, 0
+    queue = deque(parents)
+    if end in parents:
+        return parents, distances
     while queue:
-        next_node, path = queue.pop(0)
-        visited.add(next_node)
-        for neighbor in graph[next_node].neighbors:
-            if neighbor == end:
-                return path + [next_node, neighbor]
-            if neighbor in visited:
-                continue
-            neighbor_path = path + [next_node]
-            # Don't add a path to the queue if there's already a shorter or equally
-            # long path to he same node (we're only interested by the length
-            # of the final path between the start and the end nodes.)
-            idx, known_path = next(
-                (
-                    (idx, path)
-                    for idx, (point, path) in enumerate(queue)
-                    if point == neighbor
-                ),
-                (None, []),
-            )
-            if idx is not None and len(known_path) <= len(neighbor_path):
+        node = queue.popleft()
+        distance = distances[node] + 1
+        for neighbor in graph[node].neighbors:
+            if neighbor in parents:
                 continue
-            queue.append([neighbor, neighbor_path])
-    return []
+            parents[neighbor], distances[neighbor] = node, distance
+            if neighbor == end:
+                return parents, distances
+            queue.append(neighbor)
+    return parents, distances
+
+
+def bfs_distances(graph: Graph, start: Hashable) -> dict[Hashable, int]:
+    """Distances from the start node to every node reachable from it."""
+    return _bfs(graph, (start,))[1]
+
+
+def bfs_distance(graph: Graph, start: Hashable, end: Hashable) -> int | None:
+    """Length of the shortest path between start and end, None if unreachable."""
+    return _bfs(graph, (start,), end)[1].get(end)
+
+
+def bfs_multi_source_distance(
+    graph: Graph, starts: Iterable[Hashable], end: Hashable
+) -> int | None:
+    """
+    Length of the shortest path between any of the start nodes and the end node,
+    None if unreachable.
+    """
+    return _bfs(graph, starts, end)[1].get(end)
+
+
+def bfs_shortest_path(graph: Graph, start: Hashable, end: Hashable) -> list[Hashable]:
+    """
+    Finds the shortest path between start and end nodes in the graph. The path
+    includes both start and end nodes and is empty if end cannot be reached.
+    """
+    parents, _ = _bfs(graph, (start,), end)
+    if end not in parents:
+        return []
+    path = [end]
+    while (parent := parents[path[-1]]) is not None:
+        path.append(parent)
+    return path[::-1]
+
+
+UNREACHABLE = -1
+DistanceMatrix = tuple[tuple[int, ...], ...]
+
+
+def all_pairs_distances(graph: Graph) -> tuple[DistanceMatrix, dict[Hashable, int]]:
+    """
+    Computes the shortest distance between every pair of nodes with one BFS per
+    node.
+    Returns a dense distance matrix (UNREACHABLE when there's no path) and the
+    index of each node in the matrix, e.g. distances[index[a]][index[b]].
+    Results are cached by graph content so solving several times over the same
+    graph only pays for the computation once.
+    """
+    adjacency = tuple((key, frozenset(node.neighbors)) for key, node in graph.items())
+    matrix, nodes = _all_pairs_distances(adjacency)
+    return matrix, {key: idx for idx, key in enumerate(nodes)}
+
+
+@lru_cache(maxsize=32)
+def _all_pairs_distances(
+    adjacency: tuple[tuple[Hashable, frozenset[Hashable]], ...],
+) -> tuple[DistanceMatrix, tuple[Hashable, ...]]:
+    nodes = tuple(key for key, _ in adjacency)
+    index = {key: idx for idx, key in enumerate(nodes)}
+    neighbors = tuple(
+        tuple(index[neighbor] for neighbor in node_neighbors)
+        for _, node_neighbors in adjacency
+    )
+    matrix = []
+    for start in range(len(nodes)):
+        row = [UNREACHABLE] * len(nodes)
+        row[start] = 0
+        queue = deque((start,))
+        while queue:
+            node = queue.popleft()
+            distance = row[node] + 1
+            for neighbor in neighbors[node]:
+                if row[neighbor] == UNREACHABLE:
+                    row[neighbor] = distance
+                    queue.append(neighbor)
+        matrix.append(tuple(row))
+    return tuple(matrix), nodes